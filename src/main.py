@@ -6,6 +6,11 @@ from pathlib import Path
 from typing import List, Dict, Any, Optional
 from datetime import datetime, timezone
 
+# Prefer the upb protobuf backend. It only takes effect before protobuf is
+# first imported, which the google.cloud imports below do; an explicit
+# setting in the environment is left alone.
+os.environ.setdefault('PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION', 'upb')
+
 # Add src directory to Python path
 sys.path.insert(0, str(Path(__file__).parent))
 
@@ -127,10 +132,8 @@ class STTInsightsPipeline:
         Returns:
             List of GCS URIs.
         """
-        gcs_uris = []
-        for blob_name in audio_files:
-            gcs_uri = self.gcs_handler.get_gcs_uri(blob_name)
-            gcs_uris.append(gcs_uri)
+        get_gcs_uri = self.gcs_handler.get_gcs_uri
+        gcs_uris = [get_gcs_uri(blob_name) for blob_name in audio_files]
         
         self.logger.info("Converted blob names to GCS URIs", count=len(gcs_uris))
         return gcs_uris
@@ -263,7 +266,6 @@ class STTInsightsPipeline:
         processing_duration = None
         
         if start_time and end_time:
-            from datetime import datetime
             start_dt = datetime.fromisoformat(start_time)
             end_dt = datetime.fromisoformat(end_time)
             processing_duration = (end_dt - start_dt).total_seconds()
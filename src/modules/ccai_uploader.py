@@ -1,26 +1,615 @@
 """CCAI Insights uploader for STT E2E Insights with IngestConversations API support."""
 
 import asyncio
+import functools
+import itertools
 import os
-import json
-from typing import Dict, Any, List, Optional
-from datetime import datetime, timedelta
+import random
+import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, AsyncIterator, Iterable, Literal, Set, Union
+from datetime import datetime, timedelta, timezone
 
 import google.auth
+from google.api_core import exceptions as core_exceptions
 from google.cloud import contact_center_insights_v1
-from google.cloud.contact_center_insights_v1 import ContactCenterInsightsClient
+from google.cloud.contact_center_insights_v1 import ContactCenterInsightsAsyncClient
+from google.cloud.contact_center_insights_v1.services.contact_center_insights.transports import (
+    ContactCenterInsightsGrpcAsyncIOTransport
+)
 from google.cloud.contact_center_insights_v1.types import (
     Conversation, 
     IngestConversationsRequest,
     IngestConversationsMetadata,
     ConversationDataSource,
-    GcsSource
+    ConversationParticipant,
+    ConversationView,
+    CreateConversationRequest,
+    GcsSource,
+    ListConversationsRequest,
+    RedactionConfig,
+    RuntimeAnnotation,
+    SpeechConfig
 )
 from google.cloud import resourcemanager
+from google.protobuf.internal import api_implementation
+from google.protobuf.json_format import MessageToDict, ParseDict, ParseError
+from google.protobuf.duration_pb2 import Duration
+from google.protobuf.timestamp_pb2 import Timestamp
+
+try:
+    # Only used to validate the recognizer; validation is skipped without it
+    from google.cloud import speech_v1
+except ImportError:
+    speech_v1 = None
 
 from utils.logger import LoggerMixin
 from utils.config_loader import get_config_section
-from utils.async_helpers import sync_to_async, async_retry, AsyncTaskManager
+from utils.async_helpers import sync_to_async
+
+# Pre-resolved proto enum values and nested types used when building conversations
+_PHONE_CALL = Conversation.Medium.PHONE_CALL
+_CallMetadata = Conversation.CallMetadata
+_Transcript = Conversation.Transcript
+_TranscriptSegment = _Transcript.TranscriptSegment
+_WordInfo = _TranscriptSegment.WordInfo
+_WordInfoPb = _WordInfo.pb()
+
+# Formatted-data fields that map onto proto fields, per message. Anything else
+# the formatter adds (segment start/end times, call_metadata.customer_id, ...)
+# has no proto counterpart and is not sent by either conversation builder.
+# Data sources are a oneof, so the first populated source in this order wins.
+_DATA_SOURCE_FIELDS = (
+    ('gcs_source', ('audio_uri', 'transcript_uri')),
+    ('dialogflow_source', ('audio_uri', 'dialogflow_conversation')),
+)
+_CALL_METADATA_FIELDS = ('customer_channel', 'agent_channel')
+_SEGMENT_SCALAR_FIELDS = ('text', 'confidence', 'channel_tag')
+_PARTICIPANT_FIELDS = ('dialogflow_participant_name', 'obfuscated_external_user_id', 'role')
+_WORD_FIELDS = frozenset(('word', 'confidence', 'start_offset', 'end_offset'))
+
+# Enum name -> value maps, so string fields from formatted data resolve with a
+# single dict lookup instead of a getattr on the enum class
+_MEDIUM_MAP = {medium.name: medium for medium in Conversation.Medium}
+_ROLE_MAP = {role.name: role for role in ConversationParticipant.Role}
+_ROLE_UNSPECIFIED = ConversationParticipant.Role.ROLE_UNSPECIFIED
+
+# Raw enum value -> name map for reading responses off the underlying protobuf
+# message; MEDIUM_UNSPECIFIED (0) is left out so it maps to None
+_MEDIUM_NAMES = {medium.value: medium.name for medium in Conversation.Medium if medium.value}
+
+_UNIX_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+_NANOS_PER_SECOND = 1_000_000_000
+
+# Shared zero Duration for the common "0s" offset. Proto fields and message
+# constructors copy on assignment, so sharing the instance is safe.
+_ZERO_DURATION = Duration()
+_ZERO_DURATION_STRINGS = frozenset(('0s', '0.0s', '0', '0.0'))
+
+# Typed RuntimeAnnotation payload fields (the annotation "data" oneof)
+_ANNOTATION_PAYLOAD_FIELDS = frozenset((
+    'article_suggestion',
+    'faq_answer',
+    'smart_reply',
+    'smart_compose_suggestion',
+    'dialogflow_interaction',
+    'conversation_summarization_suggestion',
+))
+
+# gRPC channel options for CCAI clients. Keepalive pings stop idle channels from
+# being torn down between batches, and a local subchannel pool makes every pooled
+# channel open its own connection instead of sharing one global subchannel.
+_GRPC_CHANNEL_OPTIONS = (
+    ("grpc.max_send_message_length", -1),
+    ("grpc.max_receive_message_length", -1),
+    ("grpc.keepalive_time_ms", 30000),
+    ("grpc.http2.max_pings_without_data", 0),
+    ("grpc.use_local_subchannel_pool", 1),
+)
+
+# Transient errors worth retrying; anything else (e.g. InvalidArgument) is permanent
+_RETRYABLE_ERRORS = (
+    core_exceptions.ResourceExhausted,
+    core_exceptions.ServiceUnavailable,
+    core_exceptions.DeadlineExceeded,
+    core_exceptions.InternalServerError,
+)
+
+# Errors that mean the ingestion quota is exhausted (or the backend is shedding load)
+_QUOTA_ERRORS = (
+    core_exceptions.ResourceExhausted,
+    core_exceptions.TooManyRequests,
+    core_exceptions.ServiceUnavailable,
+)
+
+# Counts in IngestConversations 409 deduplication messages, e.g.
+# "0 failed and 2 were skipped as they already exist"
+_DEDUP_SUMMARY_RE = re.compile(r'(?P<failed>\d+) failed and (?P<skipped>\d+) were skipped')
+_SKIPPED_RE = re.compile(r'(\d+) were skipped as they already exist')
+_FAILED_RE = re.compile(r'(\d+) failed')
+
+# DLP template resource paths used for ingestion redaction
+_INSPECT_TEMPLATE_PATH = "projects/{project}/locations/{location}/inspectTemplates/{template}"
+_DEIDENTIFY_TEMPLATE_PATH = "projects/{project}/locations/{location}/deidentifyTemplates/{template}"
+
+# Long-running operation polling backoff (seconds)
+_LRO_POLL_INITIAL_DELAY = 1.0
+_LRO_POLL_MAX_DELAY = 30.0
+
+# Conversation IDs per ListConversations filter and page size for existence checks
+_EXISTS_FILTER_BATCH_SIZE = 100
+_EXISTS_PAGE_SIZE = 1000
+# Conversation IDs remembered as existing, per uploader (LRU)
+_EXISTS_CACHE_SIZE = 100_000
+
+
+@functools.lru_cache(maxsize=4096)
+def _split_duration(duration_str: str) -> tuple:
+    """Split a duration string into whole seconds and nanoseconds.
+    
+    Word and segment offsets repeat heavily (one word's end is usually the
+    next word's start), so results are cached; tuples are immutable and safe
+    to share.
+    
+    Args:
+        duration_str: Duration string (e.g., "30s", "2.5s").
+        
+    Returns:
+        Tuple of (seconds, nanos); both carry the duration's sign.
+    """
+    text = duration_str[:-1] if duration_str.endswith('s') else duration_str
+    negative = text.startswith('-')
+    whole, _, fraction = (text[1:] if negative else text).partition('.')
+    
+    # Plain decimal with up to nanosecond precision: exact integer parse
+    if ((whole.isdigit() or (not whole and fraction))
+            and (not fraction or (fraction.isdigit() and len(fraction) <= 9))):
+        seconds = int(whole) if whole else 0
+        nanos = int(fraction.ljust(9, '0')) if fraction else 0
+    else:
+        # Anything else (exponents, excess precision) goes through float
+        seconds, nanos = divmod(round(abs(float(text)) * _NANOS_PER_SECOND), _NANOS_PER_SECOND)
+        negative = float(text) < 0
+    
+    return (-seconds, -nanos) if negative else (seconds, nanos)
+
+
+def _offset_pb(offset: Optional[str]) -> Optional[Duration]:
+    """Convert a word offset string to a raw Duration, or None if absent."""
+    if not offset:
+        return None
+    if offset in _ZERO_DURATION_STRINGS:
+        return _ZERO_DURATION
+    seconds, nanos = _split_duration(offset)
+    return Duration(seconds=seconds, nanos=nanos)
+
+
+def _build_word_info_pbs(words: List[Dict[str, Any]]) -> List[Any]:
+    """Build raw WordInfo protobufs for a segment's words in one tight loop.
+    
+    Skips the proto-plus wrapper and per-word method dispatch of
+    ``_create_word_info``; offsets go through the cached duration parser.
+    Raises on malformed offsets so the caller can fall back to the per-word
+    builder, which logs and skips them.
+    
+    Args:
+        words: Word information dicts.
+        
+    Returns:
+        List of raw WordInfo protobuf messages.
+    """
+    word_info_pb = _WordInfoPb
+    offset_pb = _offset_pb
+    return [
+        word_info_pb(
+            word=word_data.get('word', ''),
+            confidence=word_data.get('confidence', 0.0),
+            start_offset=offset_pb(word_data.get('start_offset')),
+            end_offset=offset_pb(word_data.get('end_offset'))
+        )
+        for word_data in words
+    ]
+
+
+def _data_source_fields(data_source_data: Dict[str, Any]) -> Optional[Dict[str, Dict[str, Any]]]:
+    """Pick the populated source of formatted data source info.
+    
+    Args:
+        data_source_data: Data source information.
+        
+    Returns:
+        Single-entry dict of source name to its non-empty fields, or None if
+        no recognized source is populated.
+    """
+    for source, fields in _DATA_SOURCE_FIELDS:
+        source_data = data_source_data.get(source)
+        if source_data:
+            values = {field: source_data[field] for field in fields if source_data.get(field)}
+            if values:
+                return {source: values}
+    return None
+
+
+def _call_metadata_fields(metadata: Dict[str, Any]) -> Dict[str, Any]:
+    """Get the CallMetadata fields present in formatted call metadata."""
+    return {field: metadata[field] for field in _CALL_METADATA_FIELDS if field in metadata}
+
+
+def _segment_message_dict(segment_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Reduce a formatted transcript segment to TranscriptSegment fields.
+    
+    Applies the same defaults and skips the same values as the field-by-field
+    segment builders. Word dicts that already hold only WordInfo fields are
+    passed through without copying.
+    
+    Args:
+        segment_data: Segment information.
+        
+    Returns:
+        Segment dict accepted by ``ParseDict``.
+    """
+    segment = {'language_code': segment_data.get('language_code', 'en-US')}
+    for field in _SEGMENT_SCALAR_FIELDS:
+        value = segment_data.get(field)
+        if value:
+            segment[field] = value
+    
+    participant_data = segment_data.get('segment_participant')
+    if participant_data:
+        segment['segment_participant'] = {
+            field: participant_data[field] for field in _PARTICIPANT_FIELDS if field in participant_data
+        }
+    
+    words = segment_data.get('words')
+    if words:
+        segment['words'] = [
+            word_data if word_data.keys() <= _WORD_FIELDS
+            else {field: value for field, value in word_data.items() if field in _WORD_FIELDS}
+            for word_data in words
+        ]
+    
+    return segment
+
+
+def _conversation_message_dict(conversation_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Reduce formatted conversation data to Conversation fields.
+    
+    The result holds only proto field names in their JSON forms, so it can
+    be parsed strictly with ``ParseDict``; it matches what
+    ``CCAIUploader._build_conversation_object`` builds from the same data.
+    The conversation ID travels as the request's conversation_id and runtime
+    annotations are built separately, so neither is included.
+    
+    Args:
+        conversation_data: Formatted conversation data.
+        
+    Returns:
+        Conversation dict accepted by ``ParseDict``.
+    """
+    message = {
+        'medium': conversation_data.get('medium') or 'PHONE_CALL',
+        'language_code': conversation_data.get('language_code', 'en-US'),
+    }
+    # expire_time and ttl share a oneof; an explicit expiry wins
+    expire_time = conversation_data.get('expire_time')
+    if expire_time:
+        message['expire_time'] = expire_time
+    else:
+        message['ttl'] = conversation_data.get('ttl')
+    
+    data_source = conversation_data.get('data_source')
+    if data_source:
+        source = _data_source_fields(data_source)
+        if source:
+            message['data_source'] = source
+    
+    call_metadata = conversation_data.get('call_metadata')
+    if call_metadata:
+        metadata_fields = _call_metadata_fields(call_metadata)
+        if metadata_fields:
+            message['call_metadata'] = metadata_fields
+        # The agent ID is a Conversation field, not a CallMetadata one
+        if call_metadata.get('agent_id'):
+            message['agent_id'] = call_metadata['agent_id']
+    
+    transcript_data = conversation_data.get('conversation_transcript')
+    if transcript_data:
+        message['transcript'] = {
+            'transcript_segments': [
+                _segment_message_dict(segment_data)
+                for segment_data in transcript_data.get('transcript_segments', [])
+            ]
+        }
+    
+    return message
+
+
+def _resource_id(name: str) -> str:
+    """Get the trailing ID segment of a resource name, without building a list."""
+    return name.rpartition('/')[2]
+
+
+def _backoff_delay(base: float, attempt: int, cap: float, jitter: str = 'full') -> float:
+    """Compute an exponential backoff delay with optional jitter.
+    
+    Args:
+        base: Delay for the first retry, in seconds.
+        attempt: Zero-based retry attempt.
+        cap: Maximum delay in seconds.
+        jitter: 'full' for uniform(0, delay), 'equal' for delay/2 + uniform(0, delay/2),
+            'none' for the deterministic delay.
+        
+    Returns:
+        Delay in seconds.
+    """
+    delay = min(cap, base * (2 ** attempt))
+    if jitter == 'full':
+        return random.uniform(0, delay)
+    if jitter == 'equal':
+        return delay / 2 + random.uniform(0, delay / 2)
+    return delay
+
+
+def _retry_pushback_seconds(error: core_exceptions.GoogleAPICallError) -> Optional[float]:
+    """Read the server's ``grpc-retry-pushback-ms`` hint from a failed call.
+    
+    Args:
+        error: Error raised by the API call.
+        
+    Returns:
+        Requested delay in seconds, or None if the server didn't send one.
+    """
+    trailing_metadata = getattr(getattr(error, 'response', None), 'trailing_metadata', None)
+    if not callable(trailing_metadata):
+        return None
+    try:
+        for key, value in trailing_metadata() or ():
+            if key == 'grpc-retry-pushback-ms':
+                return max(int(value), 0) / 1000.0
+    except (TypeError, ValueError):
+        return None
+    return None
+
+
+# Application Default Credentials shared by every CCAI channel in the process
+_CREDENTIALS = None
+_CREDENTIALS_LOCK = threading.Lock()
+
+
+def _get_credentials() -> tuple:
+    """Get the process-wide default credentials, discovering them on first use.
+    
+    Every pooled channel authenticates with the same credentials object, so an
+    access token is minted once and reused until it nears expiry instead of
+    once per channel.
+    
+    Returns:
+        Tuple of (credentials, project_id) from google.auth.default().
+    """
+    global _CREDENTIALS
+    if _CREDENTIALS is None:
+        with _CREDENTIALS_LOCK:
+            if _CREDENTIALS is None:
+                _CREDENTIALS = google.auth.default(
+                    scopes=ContactCenterInsightsGrpcAsyncIOTransport.AUTH_SCOPES
+                )
+    return _CREDENTIALS
+
+
+def _create_async_client() -> ContactCenterInsightsAsyncClient:
+    """Create an asyncio-native CCAI client on a dedicated, tuned gRPC channel.
+    
+    The channel is bound to the event loop that is running when it is created.
+    
+    Returns:
+        ContactCenterInsightsAsyncClient instance.
+    """
+    channel = ContactCenterInsightsGrpcAsyncIOTransport.create_channel(
+        credentials=_get_credentials()[0],
+        options=list(_GRPC_CHANNEL_OPTIONS)
+    )
+    return ContactCenterInsightsAsyncClient(
+        transport=ContactCenterInsightsGrpcAsyncIOTransport(channel=channel)
+    )
+
+
+# Process-wide asyncio clients, per event loop and keyed by (location, pool size).
+# grpc.aio channels can't be used across loops. Channels hold a reference to
+# their loop, so entries are never freed implicitly: each uploader holds a
+# loop's clients from first use until close(), and the last one to let go
+# closes them.
+_ASYNC_CLIENT_CACHE: Dict[asyncio.AbstractEventLoop, Dict[tuple, List[ContactCenterInsightsAsyncClient]]] = {}
+# Number of uploaders holding each loop's clients
+_ASYNC_CLIENT_USERS: Dict[asyncio.AbstractEventLoop, int] = {}
+
+
+def _acquire_shared_async_clients(location: str, pool_size: int) -> List[ContactCenterInsightsAsyncClient]:
+    """Get the running event loop's pool of async CCAI clients, creating it on first use.
+    
+    Must be called from within a running event loop, once per uploader and
+    loop; every call must be paired with ``_release_shared_async_clients``.
+    
+    Args:
+        location: CCAI location the clients are used for.
+        pool_size: Number of clients (gRPC channels) in the pool.
+        
+    Returns:
+        List of shared ContactCenterInsightsAsyncClient instances.
+    """
+    loop = asyncio.get_running_loop()
+    _ASYNC_CLIENT_USERS[loop] = _ASYNC_CLIENT_USERS.get(loop, 0) + 1
+    loop_clients = _ASYNC_CLIENT_CACHE.setdefault(loop, {})
+    key = (location, pool_size)
+    clients = loop_clients.get(key)
+    if clients is None:
+        clients = [_create_async_client() for _ in range(pool_size)]
+        loop_clients[key] = clients
+    return clients
+
+
+def _release_shared_async_clients(loop: asyncio.AbstractEventLoop) -> List[ContactCenterInsightsAsyncClient]:
+    """Drop one uploader's hold on a loop's async clients.
+    
+    Args:
+        loop: Event loop the clients were acquired on.
+        
+    Returns:
+        The loop's clients if this was the last holder (they are forgotten
+        and must be closed by the caller), otherwise an empty list.
+    """
+    users = _ASYNC_CLIENT_USERS.get(loop, 0) - 1
+    if users > 0:
+        _ASYNC_CLIENT_USERS[loop] = users
+        return []
+    _ASYNC_CLIENT_USERS.pop(loop, None)
+    loop_clients = _ASYNC_CLIENT_CACHE.pop(loop, {})
+    return [client for clients in loop_clients.values() for client in clients]
+
+
+# Serializes Resource Manager lookups so concurrent uploaders issue at most one RPC
+_PROJECT_NUMBER_LOCK = threading.Lock()
+
+
+@functools.lru_cache(maxsize=32)
+def _lookup_project_number(project_id: str) -> str:
+    """Look up a project number via the Resource Manager API.
+    
+    Results are cached per process; failures raise and are not cached.
+    
+    Args:
+        project_id: GCP project ID.
+        
+    Returns:
+        Project number as string.
+    """
+    client = resourcemanager.ProjectsClient()
+    project = client.get_project(name=f"projects/{project_id}")
+    return _resource_id(project.name)
+
+
+def _resolve_project_number(project_id: str) -> str:
+    """Resolve a project number once per process, thread-safely.
+    
+    Args:
+        project_id: GCP project ID.
+        
+    Returns:
+        Project number as string.
+    """
+    with _PROJECT_NUMBER_LOCK:
+        return _lookup_project_number(project_id)
+
+
+class CircuitOpenError(Exception):
+    """Raised when calls are rejected because the CCAI circuit breaker is open."""
+    
+    def __init__(self, key: tuple, retry_after_seconds: float):
+        """Initialize the error.
+        
+        Args:
+            key: (project_id, location) the breaker guards.
+            retry_after_seconds: Seconds until the breaker lets a probe call through.
+        """
+        super().__init__(f"CCAI circuit breaker open for {key}; "
+                         f"retry after {retry_after_seconds:.0f}s")
+        self.key = key
+        self.retry_after_seconds = retry_after_seconds
+
+
+class _CCAIBreaker:
+    """Circuit breaker (closed -> open -> half-open) for quota-exhausted CCAI calls.
+    
+    Opens after ``failure_threshold`` consecutive quota failures and rejects calls
+    until ``reset_seconds`` have passed; then lets up to ``half_open_max`` probe
+    calls through. A successful probe closes the breaker, a failed one reopens it.
+    """
+    
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+    
+    def __init__(self, key: tuple, failure_threshold: int = 5,
+                 reset_seconds: float = 120, half_open_max: int = 1):
+        self.key = key
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self.half_open_max = half_open_max
+        self.state = self.CLOSED
+        self.failure_count = 0
+        self.opened_at = 0.0
+        self._half_open_calls = 0
+        self._lock = threading.Lock()
+    
+    def before_call(self) -> None:
+        """Admit or reject a call.
+        
+        Raises:
+            CircuitOpenError: If the breaker is open, or half-open with all
+                probe slots taken.
+        """
+        with self._lock:
+            if self.state == self.OPEN:
+                remaining = self.opened_at + self.reset_seconds - time.monotonic()
+                if remaining > 0:
+                    raise CircuitOpenError(self.key, remaining)
+                self.state = self.HALF_OPEN
+                self._half_open_calls = 0
+            if self.state == self.HALF_OPEN:
+                if self._half_open_calls >= self.half_open_max:
+                    raise CircuitOpenError(self.key, self.reset_seconds)
+                self._half_open_calls += 1
+    
+    def on_success(self) -> None:
+        """Record a call that was not throttled."""
+        with self._lock:
+            self.state = self.CLOSED
+            self.failure_count = 0
+            self._half_open_calls = 0
+    
+    def release(self) -> None:
+        """Give back the probe slot of an admitted call that ended without an
+        outcome, e.g. because it was cancelled."""
+        with self._lock:
+            if self.state == self.HALF_OPEN and self._half_open_calls > 0:
+                self._half_open_calls -= 1
+    
+    def on_failure(self) -> None:
+        """Record a quota failure."""
+        with self._lock:
+            self.failure_count += 1
+            if self.state == self.HALF_OPEN or self.failure_count >= self.failure_threshold:
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+
+
+# Breakers shared by every uploader targeting the same (project_id, location)
+_BREAKERS: Dict[tuple, _CCAIBreaker] = {}
+_BREAKER_LOCK = threading.Lock()
+
+
+def _get_breaker(key: tuple, failure_threshold: int, reset_seconds: float,
+                 half_open_max: int) -> _CCAIBreaker:
+    """Get the process-wide circuit breaker for a project and location.
+    
+    Args:
+        key: (project_id, location).
+        failure_threshold: Consecutive quota failures that open the breaker.
+        reset_seconds: Seconds the breaker stays open before probing.
+        half_open_max: Probe calls allowed while half-open.
+        
+    Returns:
+        Shared _CCAIBreaker instance. Thresholds of the first caller win.
+    """
+    with _BREAKER_LOCK:
+        breaker = _BREAKERS.get(key)
+        if breaker is None:
+            breaker = _CCAIBreaker(key, failure_threshold, reset_seconds, half_open_max)
+            _BREAKERS[key] = breaker
+        return breaker
 
 
 class CCAIUploader(LoggerMixin):
@@ -35,6 +624,7 @@ class CCAIUploader(LoggerMixin):
         try:
             gcp_config = get_config_section('gcp')
             self.ccai_config = get_config_section('ccai')
+            processing_config = get_config_section('processing')
         except KeyError as e:
             raise ValueError(f"Missing configuration section: {e}")
         
@@ -43,8 +633,7 @@ class CCAIUploader(LoggerMixin):
         if not self.project_id:
             # Try to get from default GCP environment
             try:
-                import google.auth
-                _, project_id_from_env = google.auth.default()
+                _, project_id_from_env = _get_credentials()
                 self.project_id = project_id_from_env
             except Exception:
                 pass
@@ -55,22 +644,174 @@ class CCAIUploader(LoggerMixin):
         self.location = self.ccai_config.get('location', 'us-central1')
         self.recognizer_id = self.ccai_config.get('recognizer_id', 'ccai-insights-recognizer')
         
+        # Cache config values used on per-batch and per-conversation paths
+        # At least one upload worker, or batches would produce no results
+        self._max_concurrent_uploads = max(1, self.ccai_config.get(
+            'max_concurrent_uploads', processing_config.get('max_concurrent_files', 5)))
+        self._upload_politeness_seconds = self.ccai_config.get('upload_politeness_seconds', 0)
+        self._create_max_attempts = max(1, self.ccai_config.get('create_max_attempts', 3))
+        self._create_retry_delay = self.ccai_config.get('create_retry_delay_seconds', 2.0)
+        self._ingest_batch_threshold = self.ccai_config.get('ingest_batch_threshold', 10)
+        self._batch_upload_strategy = self.ccai_config.get('batch_upload_strategy', 'create')
+        self._retry_max_delay = self.ccai_config.get('retry_max_delay', 600)
+        self._retry_jitter = self.ccai_config.get('retry_jitter', 'full')
+        self._ingest_total_deadline = self.ccai_config.get('ingest_total_deadline_seconds', 300)
+        self._max_concurrent_ingests = max(1, self.ccai_config.get('max_concurrent_ingests', 1))
+        self._max_concurrent_lro_polls = max(1, self.ccai_config.get('max_concurrent_lro_polls', 10))
+        self._ingest_semaphores = None
+        self._ingest_semaphores_loop = None
+        self._speech_client = None
+        self._exists_cache: "OrderedDict[str, None]" = OrderedDict()
+        self._breaker = _get_breaker(
+            (self.project_id, self.location),
+            failure_threshold=self.ccai_config.get('breaker_failure_threshold', 5),
+            reset_seconds=self.ccai_config.get('breaker_reset_seconds', 120),
+            half_open_max=self.ccai_config.get('breaker_half_open_max', 1)
+        )
+        self._customer_channel = self.ccai_config.get('customer_channel', 1)
+        self._agent_channel = self.ccai_config.get('agent_channel', 2)
+        
         # Get project number for recognizer path (CCAI requires project number, not project ID)
         self.project_number = self._get_project_number()
         
-        # Initialize CCAI client
-        self.client = ContactCenterInsightsClient()
+        # RPCs go through asyncio-native clients. Each client owns its own gRPC
+        # channel, so a pool spreads concurrent uploads over several HTTP/2
+        # connections. grpc.aio channels are bound to the event loop they are
+        # created on, so the shared pool is looked up lazily inside the running loop.
+        # Without an explicit size, scale the pool with file concurrency
+        pool_size = self.ccai_config.get('grpc_pool_size', processing_config.get('grpc_pool_size'))
+        if pool_size is None:
+            pool_size = max(4, processing_config.get('max_concurrent_files', 5) // 4)
+        pool_size = max(1, int(pool_size))
+        self._grpc_pool_size = pool_size
+        self._async_clients: List[ContactCenterInsightsAsyncClient] = []
+        self._async_client_cycle = None
+        self._async_clients_loop = None
+        
+        # The few remaining blocking calls (the Speech recognizer lookup) run on
+        # a small dedicated pool, so they don't queue behind other work on the
+        # event loop's default executor; uploads themselves are async
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(1, self.ccai_config.get('executor_threads', 2)),
+            thread_name_prefix='ccai')
         
         # Build parent path and recognizer path
         self.parent = f"projects/{self.project_id}/locations/{self.location}"
         self.recognizer_path = f"projects/{self.project_number}/locations/{self.location}/recognizers/{self.recognizer_id}"
         
+        # Ingestion configs depend only on static settings, so build them once
+        self.refresh_configs()
+        
         self.logger.info("CCAI uploader initialized",
                         project_id=self.project_id,
                         project_number=self.project_number,
                         location=self.location,
                         recognizer_id=self.recognizer_id,
-                        recognizer_path=self.recognizer_path)
+                        recognizer_path=self.recognizer_path,
+                        grpc_pool_size=pool_size)
+        
+        # Transcript/word proto construction is the main CPU cost of uploads and is
+        # several times slower on the pure-Python protobuf runtime than on upb/C++
+        if api_implementation.Type() == 'python':
+            self.logger.warning("Pure-Python protobuf runtime detected; conversation building will be slow. "
+                              "Use protobuf with the upb backend (PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION=upb)",
+                              protobuf_implementation=api_implementation.Type())
+    
+    def refresh_configs(self) -> None:
+        """Rebuild the cached IngestConversations configs from current settings.
+        
+        Call after changing the uploader's location, recognizer or channel
+        settings, or the DLP configuration.
+        """
+        self._transcript_object_config = self._create_transcript_object_config()
+        self._conversation_config = self._create_conversation_config()
+        self._speech_config = self._create_speech_config()
+        self._redaction_config = self._create_redaction_config_for_request()
+    
+    async def close(self) -> None:
+        """Release the uploader's async clients, worker threads and Speech client.
+        
+        The async clients are shared by every uploader on the event loop; they
+        are closed when the last uploader using them is closed.
+        """
+        await self._release_loop_state()
+        if self._speech_client is not None:
+            self._speech_client.transport.close()
+            self._speech_client = None
+        self._executor.shutdown(wait=False)
+    
+    async def _release_loop_state(self) -> None:
+        """Release this uploader's hold on its loop's clients and drop its semaphores."""
+        loop = self._async_clients_loop
+        self._async_clients = []
+        self._async_client_cycle = None
+        self._async_clients_loop = None
+        self._ingest_semaphores = None
+        self._ingest_semaphores_loop = None
+        if loop is None:
+            return
+        
+        clients = _release_shared_async_clients(loop)
+        # Channels can only be closed on their own loop; a finished loop's
+        # channels are simply dropped
+        if clients and loop is asyncio.get_running_loop():
+            for client in clients:
+                await client.transport.close()
+    
+    async def __aenter__(self) -> 'CCAIUploader':
+        return self
+    
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.close()
+    
+    def _get_ingest_semaphores(self) -> tuple:
+        """Get the bulkhead semaphores for the running event loop.
+        
+        Ingestion starts and LRO polling are limited separately, so waiting on
+        long operations never blocks new submissions. Created lazily, since the
+        uploader may be constructed outside an event loop.
+        
+        Returns:
+            Tuple of (ingest semaphore, LRO polling semaphore).
+        """
+        loop = asyncio.get_running_loop()
+        if self._ingest_semaphores_loop is not loop:
+            self._ingest_semaphores = (
+                asyncio.Semaphore(self._max_concurrent_ingests),
+                asyncio.Semaphore(self._max_concurrent_lro_polls),
+            )
+            self._ingest_semaphores_loop = loop
+        return self._ingest_semaphores
+    
+    def _next_async_client(self) -> ContactCenterInsightsAsyncClient:
+        """Get the next async client for the running event loop in round-robin order.
+        
+        Returns:
+            ContactCenterInsightsAsyncClient instance.
+        """
+        loop = asyncio.get_running_loop()
+        if self._async_clients_loop is not loop:
+            if self._async_clients_loop is not None:
+                # Moved to a new loop without closing; the old loop's channels
+                # can't be closed from here, so only the hold is dropped
+                _release_shared_async_clients(self._async_clients_loop)
+            self._async_clients = _acquire_shared_async_clients(self.location, self._grpc_pool_size)
+            self._async_client_cycle = itertools.cycle(self._async_clients)
+            self._async_clients_loop = loop
+        return next(self._async_client_cycle)
+    
+    @staticmethod
+    def _get_operation_name(operation: Any) -> str:
+        """Get the name of a long-running operation.
+        
+        Args:
+            operation: api_core Operation/AsyncOperation.
+            
+        Returns:
+            Operation name, or an object-ID based placeholder if unavailable.
+        """
+        operation_pb = getattr(operation, 'operation', None)
+        return getattr(operation_pb, 'name', None) or f"operation-{id(operation)}"
     
     def _get_project_number(self) -> str:
         """Get the project number using multiple fallback methods.
@@ -78,9 +819,9 @@ class CCAIUploader(LoggerMixin):
         CCAI Insights recognizer paths require project number, not project ID.
         
         Tries in order:
-        1. Environment variable GCP_PROJECT_NUMBER
+        1. Environment variable GCP_PROJECT_NUMBER or GOOGLE_CLOUD_PROJECT_NUMBER
         2. Config file project_number field
-        3. Resource Manager API (if permissions available)
+        3. Resource Manager API (if permissions available, cached per process)
         4. Fallback to project_id (for compatibility)
         
         Returns:
@@ -90,7 +831,7 @@ class CCAIUploader(LoggerMixin):
             ValueError: If project number cannot be retrieved.
         """
         # Method 1: Environment variable
-        env_project_number = os.getenv('GCP_PROJECT_NUMBER')
+        env_project_number = os.getenv('GCP_PROJECT_NUMBER') or os.getenv('GOOGLE_CLOUD_PROJECT_NUMBER')
         if env_project_number:
             self.logger.debug("Using project number from environment", 
                             project_number=env_project_number)
@@ -107,17 +848,9 @@ class CCAIUploader(LoggerMixin):
         except Exception as e:
             self.logger.debug("Config project_number not available", error=str(e))
         
-        # Method 3: Resource Manager API
+        # Method 3: Resource Manager API (one RPC per project per process)
         try:
-            # Initialize Resource Manager client
-            client = resourcemanager.ProjectsClient()
-            
-            # Get project details
-            project_name = f"projects/{self.project_id}"
-            project = client.get_project(name=project_name)
-            
-            # Extract project number
-            project_number = project.name.split('/')[-1]
+            project_number = _resolve_project_number(self.project_id)
             
             self.logger.debug("Retrieved project number via Resource Manager API", 
                             project_id=self.project_id,
@@ -137,7 +870,6 @@ class CCAIUploader(LoggerMixin):
                           project_id=self.project_id)
         return self.project_id
     
-    @async_retry(max_attempts=3, delay_seconds=2.0)
     async def upload_conversation(self, conversation_data: Dict[str, Any]) -> Dict[str, Any]:
         """Upload a single conversation to CCAI Insights.
         
@@ -147,40 +879,43 @@ class CCAIUploader(LoggerMixin):
         Returns:
             Dictionary containing upload result and conversation details.
         """
-        conversation_id = conversation_data.get('name', '').split('/')[-1]
+        conversation_id = _resource_id(conversation_data.get('name', ''))
         self.logger.debug("Uploading conversation to CCAI Insights",
                          conversation_id=conversation_id)
         
         try:
-            # Create conversation object
-            conversation = self._create_conversation_object(conversation_data)
+            # Build the request once; only the RPC itself is retried
+            request = self._prepare_request(conversation_data, conversation_id)
             
             # Create the conversation
-            request = {
-                "parent": self.parent,
-                "conversation": conversation,
-                "conversation_id": conversation_id
-            }
-            
-            response = await sync_to_async(self.client.create_conversation)(request)
+            response = await self._send_create(request)
             
+            # Read every field off the raw message; proto-plus would otherwise
+            # wrap each access (datetime conversion, enum construction)
+            response_pb = Conversation.pb(response)
             result = {
                 'success': True,
                 'conversation_id': conversation_id,
-                'conversation_name': response.name,
-                'create_time': response.create_time.isoformat() if response.create_time else None,
-                'state': response.state.name if response.state else None,
-                'medium': response.medium.name if response.medium else None,
+                'conversation_name': response_pb.name,
+                'create_time': response_pb.create_time.ToJsonString() if response_pb.HasField('create_time') else None,
+                # Conversation has no state field; kept for the result's shape
+                'state': None,
+                'medium': _MEDIUM_NAMES.get(response_pb.medium),
                 'error': None
             }
             
+            # Re-runs of the batch can then skip the existence RPC for it
+            self._remember_existing((conversation_id,))
+            
             self.logger.info("Conversation uploaded successfully",
                            conversation_id=conversation_id,
-                           conversation_name=response.name)
+                           conversation_name=response_pb.name)
             
             return result
             
         except Exception as e:
+            if isinstance(e, core_exceptions.AlreadyExists):
+                self._remember_existing((conversation_id,))
             error_msg = str(e)
             self.logger.error("Failed to upload conversation",
                             conversation_id=conversation_id,
@@ -196,114 +931,217 @@ class CCAIUploader(LoggerMixin):
                 'error': error_msg
             }
     
+    def _prepare_request(self, conversation_data: Dict[str, Any],
+                         conversation_id: str) -> CreateConversationRequest:
+        """Build the CreateConversation request for a conversation.
+        
+        Args:
+            conversation_data: Formatted conversation data from CCAIFormatter.
+            conversation_id: ID to create the conversation under.
+            
+        Returns:
+            CreateConversation request message, passed to the client as-is.
+        """
+        return CreateConversationRequest(
+            parent=self.parent,
+            conversation=self._create_conversation_object(conversation_data),
+            conversation_id=conversation_id
+        )
+    
+    async def _send_create(self, request: CreateConversationRequest) -> Conversation:
+        """Send a CreateConversation request, retrying transient failures.
+        
+        Only throttling and transient server errors are retried, with jittered
+        exponential backoff (or the server's retry pushback when it sends one).
+        Client errors such as InvalidArgument fail immediately.
+        
+        Args:
+            request: Prebuilt CreateConversation request payload.
+            
+        Returns:
+            The created Conversation.
+        """
+        for attempt in range(self._create_max_attempts):
+            try:
+                return await self._next_async_client().create_conversation(request=request)
+            except _RETRYABLE_ERRORS as e:
+                if attempt + 1 >= self._create_max_attempts:
+                    raise
+                delay = _retry_pushback_seconds(e)
+                if delay is None:
+                    delay = (self._create_retry_delay * 2 ** attempt
+                             + random.uniform(0, self._create_retry_delay))
+                self.logger.warning("CreateConversation failed, retrying",
+                                  attempt=attempt + 1,
+                                  delay_seconds=round(delay, 2),
+                                  error=str(e))
+                await asyncio.sleep(delay)
+    
     def _create_conversation_object(self, conversation_data: Dict[str, Any]) -> Conversation:
         """Create a Conversation object from formatted data.
         
+        The formatted data is reduced to proto fields (timestamps and
+        durations in their JSON forms) and parsed in a single ``ParseDict``
+        call. Runtime annotations carry a custom payload shape and are built
+        separately. Data with values ParseDict rejects (e.g. unknown enum
+        names or non-JSON durations) falls back to the field-by-field
+        builders, which produce the same message for data both accept.
+        
         Args:
             conversation_data: Formatted conversation data.
             
         Returns:
             Conversation object for the API.
         """
-        # Extract basic information
-        medium = getattr(Conversation.Medium, conversation_data.get('medium', 'PHONE_CALL'))
+        try:
+            conversation = Conversation.wrap(
+                ParseDict(_conversation_message_dict(conversation_data), Conversation.pb()())
+            )
+        except (ParseError, TypeError, AttributeError) as e:
+            self.logger.debug("Falling back to field-by-field conversation build",
+                            error=str(e))
+            return self._build_conversation_object(conversation_data)
         
-        # Create conversation object
-        conversation = Conversation(
-            medium=medium,
-            language_code=conversation_data.get('language_code', 'en-US'),
-            expire_time=self._parse_timestamp(conversation_data.get('expire_time')),
-            ttl=self._parse_duration(conversation_data.get('ttl'))
-        )
+        annotations = conversation_data.get('runtime_annotations')
+        if annotations:
+            conversation.runtime_annotations = [
+                self._create_runtime_annotation(ann) for ann in annotations
+            ]
+        
+        return conversation
+    
+    def _build_conversation_object(self, conversation_data: Dict[str, Any]) -> Conversation:
+        """Create a Conversation object field by field from formatted data.
+        
+        Args:
+            conversation_data: Formatted conversation data.
+            
+        Returns:
+            Conversation object for the API.
+        """
+        # Collect every field and build the conversation in one constructor
+        # call; builders return None for absent parts, which the constructor skips
+        fields = {
+            'medium': _MEDIUM_MAP.get(conversation_data.get('medium') or 'PHONE_CALL', _PHONE_CALL),
+            'language_code': conversation_data.get('language_code', 'en-US'),
+        }
+        
+        # expire_time and ttl share a oneof; an explicit expiry wins
+        expire_time = self._parse_timestamp(conversation_data.get('expire_time'))
+        if expire_time:
+            fields['expire_time'] = expire_time
+        else:
+            fields['ttl'] = self._parse_duration(conversation_data.get('ttl'))
         
-        # Add data source if present
         data_source = conversation_data.get('data_source')
         if data_source:
-            conversation.data_source = self._create_data_source(data_source)
+            fields['data_source'] = self._create_data_source(data_source)
         
-        # Add call metadata if present
         call_metadata = conversation_data.get('call_metadata')
         if call_metadata:
-            conversation.call_metadata = self._create_call_metadata(call_metadata)
+            fields['call_metadata'] = self._create_call_metadata(call_metadata)
+            # The agent ID is a Conversation field, not a CallMetadata one
+            fields['agent_id'] = call_metadata.get('agent_id') or None
         
-        # Add conversation transcript
         transcript_data = conversation_data.get('conversation_transcript')
         if transcript_data:
-            conversation.transcript = self._create_transcript(transcript_data)
+            fields['transcript'] = self._create_transcript(transcript_data)
         
-        # Add runtime annotations
         annotations = conversation_data.get('runtime_annotations', [])
         if annotations:
-            conversation.runtime_annotations = [
+            fields['runtime_annotations'] = [
                 self._create_runtime_annotation(ann) for ann in annotations
             ]
         
-        return conversation
+        return Conversation(**fields)
     
-    def _create_data_source(self, data_source_data: Dict[str, Any]) -> Any:
+    def _create_data_source(self, data_source_data: Dict[str, Any]) -> Optional[ConversationDataSource]:
         """Create data source object.
         
         Args:
             data_source_data: Data source information.
             
         Returns:
-            DataSource object.
+            DataSource object, or None if no recognized source is populated.
         """
-        from google.cloud.contact_center_insights_v1.types import ConversationDataSource
-        
-        data_source = ConversationDataSource()
-        
-        # Handle different source types
-        if 'dialogflow_source' in data_source_data:
-            df_source = data_source_data['dialogflow_source']
-            if df_source.get('audio_uri'):
-                # Note: The actual API structure may differ, adapt as needed
-                data_source.dialogflow_source.audio_uri = df_source['audio_uri']
+        source = _data_source_fields(data_source_data)
+        if not source:
+            # An empty submessage would still be sent on the wire
+            return None
         
-        return data_source
+        return ConversationDataSource(**source)
     
-    def _create_call_metadata(self, metadata: Dict[str, Any]) -> Any:
+    def _create_call_metadata(self, metadata: Dict[str, Any]) -> Optional[Any]:
         """Create call metadata object.
         
         Args:
             metadata: Call metadata information.
             
         Returns:
-            CallMetadata object.
+            CallMetadata object, or None if none of its fields are present.
         """
-        from google.cloud.contact_center_insights_v1.types import Conversation
-        
-        call_metadata = Conversation.CallMetadata()
-        
-        if 'customer_channel' in metadata:
-            call_metadata.customer_channel = metadata['customer_channel']
-        if 'agent_channel' in metadata:
-            call_metadata.agent_channel = metadata['agent_channel']
-        if 'agent_id' in metadata:
-            call_metadata.agent_id = metadata['agent_id']
-        if 'customer_id' in metadata:
-            call_metadata.customer_id = metadata['customer_id']
+        fields = _call_metadata_fields(metadata)
+        if not fields:
+            # An empty submessage would still be sent on the wire
+            return None
         
-        return call_metadata
+        return _CallMetadata(**fields)
     
     def _create_transcript(self, transcript_data: Dict[str, Any]) -> Any:
         """Create conversation transcript object.
         
+        Segments and participants are built in one pass straight into the
+        underlying protobuf containers: ``add()`` constructs each segment in
+        place instead of building a wrapped segment and copying it in. Segments
+        with malformed data fall back to ``_create_transcript_segment``.
+        
+        TranscriptSegment has no segment-level start/end time fields; timing is
+        carried by the word offsets, so ``segment_start_time`` and
+        ``segment_end_time`` in the formatted data are not sent.
+        
         Args:
             transcript_data: Transcript information.
             
         Returns:
-            ConversationTranscript object.
+            Conversation.Transcript object.
         """
-        from google.cloud.contact_center_insights_v1.types import ConversationTranscript
+        transcript = _Transcript()
+        segments = transcript_data.get('transcript_segments', [])
+        if not segments:
+            return transcript
         
-        transcript = ConversationTranscript()
+        segments_pb = _Transcript.pb(transcript).transcript_segments
+        add_segment = segments_pb.add
         
-        # Add transcript segments
-        segments = transcript_data.get('transcript_segments', [])
         for segment_data in segments:
-            segment = self._create_transcript_segment(segment_data)
-            transcript.transcript_segments.append(segment)
+            added = len(segments_pb)
+            try:
+                # None values (missing keys) are left unset
+                segment_pb = add_segment(
+                    language_code=segment_data.get('language_code', 'en-US'),
+                    text=segment_data.get('text') or None,
+                    confidence=segment_data.get('confidence') or None,
+                    channel_tag=segment_data.get('channel_tag') or None
+                )
+                
+                participant_data = segment_data.get('segment_participant')
+                if participant_data:
+                    participant_pb = segment_pb.segment_participant
+                    participant_pb.SetInParent()
+                    if 'dialogflow_participant_name' in participant_data:
+                        participant_pb.dialogflow_participant_name = participant_data['dialogflow_participant_name']
+                    if 'obfuscated_external_user_id' in participant_data:
+                        participant_pb.obfuscated_external_user_id = participant_data['obfuscated_external_user_id']
+                    if 'role' in participant_data:
+                        participant_pb.role = _ROLE_MAP.get(participant_data['role'], _ROLE_UNSPECIFIED)
+                
+                words = segment_data.get('words')
+                if words:
+                    segment_pb.words.extend(_build_word_info_pbs(words))
+            except (TypeError, ValueError, AttributeError, OverflowError):
+                # Drop any partial segment; the per-field builders log and skip bad values
+                del segments_pb[added:]
+                segments_pb.extend([_TranscriptSegment.pb(self._create_transcript_segment(segment_data))])
         
         return transcript
     
@@ -314,33 +1152,38 @@ class CCAIUploader(LoggerMixin):
             segment_data: Segment information.
             
         Returns:
-            ConversationTranscript.TranscriptSegment object.
+            Conversation.Transcript.TranscriptSegment object.
         """
-        from google.cloud.contact_center_insights_v1.types import ConversationTranscript
-        
-        segment = ConversationTranscript.TranscriptSegment()
-        
-        segment.text = segment_data.get('text', '')
-        segment.confidence = segment_data.get('confidence', 0.0)
-        segment.language_code = segment_data.get('language_code', 'en-US')
-        segment.channel_tag = segment_data.get('channel_tag', 0)
-        
-        # Add timing information
-        if 'segment_start_time' in segment_data:
-            segment.segment_start_time = self._parse_duration(segment_data['segment_start_time'])
-        if 'segment_end_time' in segment_data:
-            segment.segment_end_time = self._parse_duration(segment_data['segment_end_time'])
+        # Collect the fields and build the segment in one constructor call.
+        # Proto3 defaults ('', 0) are never serialized, so only non-default
+        # values are passed; unset durations (None) are skipped by the constructor.
+        fields = {'language_code': segment_data.get('language_code', 'en-US')}
+        text = segment_data.get('text')
+        if text:
+            fields['text'] = text
+        confidence = segment_data.get('confidence')
+        if confidence:
+            fields['confidence'] = confidence
+        channel_tag = segment_data.get('channel_tag')
+        if channel_tag:
+            fields['channel_tag'] = channel_tag
         
         # Add participant information
         participant_data = segment_data.get('segment_participant', {})
         if participant_data:
-            segment.segment_participant = self._create_participant(participant_data)
+            fields['segment_participant'] = self._create_participant(participant_data)
+        
+        segment = _TranscriptSegment(**fields)
         
         # Add word-level information
         words = segment_data.get('words', [])
-        for word_data in words:
-            word = self._create_word_info(word_data)
-            segment.words.append(word)
+        if words:
+            try:
+                word_pbs = _build_word_info_pbs(words)
+            except (TypeError, ValueError, AttributeError, OverflowError):
+                # Malformed word data: per-word builder logs and skips bad offsets
+                word_pbs = [_WordInfo.pb(self._create_word_info(word_data)) for word_data in words]
+            _TranscriptSegment.pb(segment).words.extend(word_pbs)
         
         return segment
     
@@ -353,20 +1196,15 @@ class CCAIUploader(LoggerMixin):
         Returns:
             ConversationParticipant object.
         """
-        from google.cloud.contact_center_insights_v1.types import ConversationParticipant
-        
-        participant = ConversationParticipant()
-        
+        fields = {}
         if 'dialogflow_participant_name' in participant_data:
-            participant.dialogflow_participant_name = participant_data['dialogflow_participant_name']
+            fields['dialogflow_participant_name'] = participant_data['dialogflow_participant_name']
         if 'obfuscated_external_user_id' in participant_data:
-            participant.obfuscated_external_user_id = participant_data['obfuscated_external_user_id']
+            fields['obfuscated_external_user_id'] = participant_data['obfuscated_external_user_id']
         if 'role' in participant_data:
-            role = getattr(ConversationParticipant.Role, participant_data['role'], 
-                          ConversationParticipant.Role.ROLE_UNSPECIFIED)
-            participant.role = role
+            fields['role'] = _ROLE_MAP.get(participant_data['role'], _ROLE_UNSPECIFIED)
         
-        return participant
+        return ConversationParticipant(**fields)
     
     def _create_word_info(self, word_data: Dict[str, Any]) -> Any:
         """Create word information object.
@@ -377,19 +1215,13 @@ class CCAIUploader(LoggerMixin):
         Returns:
             WordInfo object.
         """
-        from google.cloud.contact_center_insights_v1.types import ConversationTranscript
-        
-        word_info = ConversationTranscript.TranscriptSegment.WordInfo()
-        
-        word_info.word = word_data.get('word', '')
-        word_info.confidence = word_data.get('confidence', 0.0)
-        
-        if 'start_offset' in word_data:
-            word_info.start_offset = self._parse_duration(word_data['start_offset'])
-        if 'end_offset' in word_data:
-            word_info.end_offset = self._parse_duration(word_data['end_offset'])
-        
-        return word_info
+        # One constructor call; missing offsets parse to None and are left unset
+        return _WordInfo(
+            word=word_data.get('word', ''),
+            confidence=word_data.get('confidence', 0.0),
+            start_offset=self._parse_duration(word_data.get('start_offset')),
+            end_offset=self._parse_duration(word_data.get('end_offset'))
+        )
     
     def _create_runtime_annotation(self, annotation_data: Dict[str, Any]) -> Any:
         """Create runtime annotation object.
@@ -400,108 +1232,318 @@ class CCAIUploader(LoggerMixin):
         Returns:
             RuntimeAnnotation object.
         """
-        from google.cloud.contact_center_insights_v1.types import RuntimeAnnotation
-        import json
-        
-        annotation = RuntimeAnnotation()
-        
-        annotation.annotation_id = annotation_data.get('annotation_id', '')
+        annotation_id = annotation_data.get('annotation_id', '')
+        fields = {'annotation_id': annotation_id}
         
         if 'create_time' in annotation_data:
-            annotation.create_time = self._parse_timestamp(annotation_data['create_time'])
+            fields['create_time'] = self._parse_timestamp(annotation_data['create_time'])
         
-        # Add annotation payload as JSON
+        # Add annotation payload as its typed submessage; payload dicts are keyed
+        # by the oneof field name and converted to the proto message natively
         payload = annotation_data.get('annotation_payload', {})
-        if payload:
-            # Note: The actual structure may differ based on API requirements
-            annotation.annotation_payload = json.dumps(payload)
+        for field_name, value in payload.items():
+            if field_name in _ANNOTATION_PAYLOAD_FIELDS:
+                fields[field_name] = value
+            else:
+                self.logger.warning("Unsupported runtime annotation payload field",
+                                  annotation_id=annotation_id,
+                                  field=field_name)
         
-        return annotation
+        return RuntimeAnnotation(**fields)
     
-    def _parse_timestamp(self, timestamp_str: Optional[str]) -> Optional[Any]:
+    def _parse_timestamp(self, timestamp_str: Optional[Union[str, datetime, Timestamp]]) -> Optional[Any]:
         """Parse timestamp string to protobuf Timestamp.
         
+        RFC 3339 strings are parsed by protobuf directly; other ISO forms (e.g.
+        without a UTC offset) fall back to ``datetime.fromisoformat``. Prebuilt
+        ``Timestamp`` messages pass through unchanged and ``datetime`` values
+        are converted directly, so formatters can skip ISO serialization.
+        
         Args:
-            timestamp_str: Timestamp string in ISO format.
+            timestamp_str: Timestamp string in ISO format, datetime or Timestamp.
             
         Returns:
             Protobuf Timestamp object or None.
         """
         if not timestamp_str:
             return None
+        if isinstance(timestamp_str, Timestamp):
+            return timestamp_str
         
         try:
-            from google.protobuf.timestamp_pb2 import Timestamp
-            from datetime import datetime
-            
-            # Parse ISO timestamp
-            dt = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
-            
-            timestamp = Timestamp()
-            timestamp.FromDatetime(dt)
-            return timestamp
+            if isinstance(timestamp_str, datetime):
+                dt = timestamp_str
+            else:
+                timestamp = Timestamp()
+                try:
+                    timestamp.FromJsonString(timestamp_str)
+                    return timestamp
+                except ValueError:
+                    # Naive or otherwise non-RFC 3339 ISO strings
+                    dt = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
+            
+            # Epoch offset via timedelta arithmetic; naive values are UTC, as with FromDatetime
+            if dt.tzinfo is None:
+                dt = dt.replace(tzinfo=timezone.utc)
+            delta = dt - _UNIX_EPOCH
+            return Timestamp(seconds=delta.days * 86400 + delta.seconds,
+                             nanos=delta.microseconds * 1000)
         except Exception as e:
-            self.logger.warning("Failed to parse timestamp", timestamp=timestamp_str, error=str(e))
+            self.logger.warning("Failed to parse timestamp", timestamp=str(timestamp_str), error=str(e))
             return None
     
-    def _parse_duration(self, duration_str: Optional[str]) -> Optional[Any]:
+    def _parse_duration(self, duration_str: Optional[Union[str, timedelta, Duration]]) -> Optional[Any]:
         """Parse duration string to protobuf Duration.
         
+        Prebuilt ``Duration`` messages pass through unchanged and ``timedelta``
+        values are converted directly.
+        
         Args:
-            duration_str: Duration string (e.g., "30s", "2.5s").
+            duration_str: Duration string (e.g., "30s", "2.5s"), timedelta or Duration.
             
         Returns:
             Protobuf Duration object or None.
         """
         if not duration_str:
             return None
+        if isinstance(duration_str, Duration):
+            return duration_str
         
         try:
-            from google.protobuf.duration_pb2 import Duration
-            
-            # Remove 's' suffix and parse as float
-            seconds = float(duration_str.rstrip('s'))
-            
-            duration = Duration()
-            duration.seconds = int(seconds)
-            duration.nanos = int((seconds - int(seconds)) * 1_000_000_000)
-            return duration
+            if isinstance(duration_str, timedelta):
+                return Duration(seconds=duration_str.days * 86400 + duration_str.seconds,
+                                nanos=duration_str.microseconds * 1000)
+            if duration_str in _ZERO_DURATION_STRINGS:
+                return _ZERO_DURATION
+            seconds, nanos = _split_duration(duration_str)
+            return Duration(seconds=seconds, nanos=nanos)
         except Exception as e:
-            self.logger.warning("Failed to parse duration", duration=duration_str, error=str(e))
+            self.logger.warning("Failed to parse duration", duration=str(duration_str), error=str(e))
             return None
     
-    async def batch_upload_conversations(self, conversations: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Upload multiple conversations concurrently.
+    async def batch_upload_conversations(self, conversations: Iterable[Dict[str, Any]],
+                                         strategy: Optional[Literal['create', 'ingest']] = None,
+                                         force_unary: bool = False
+                                         ) -> AsyncIterator[Dict[str, Any]]:
+        """Upload multiple conversations concurrently, yielding results as they complete.
+        
+        Results stream in completion order, so downstream stages can start on the
+        first finished upload instead of waiting for the slowest one. Uploads run
+        on a fixed pool of workers fed through a bounded queue, so at most
+        ``2 * max_concurrent_uploads`` conversations are held at once and
+        ``conversations`` may be a lazy generator.
+        
+        With ``strategy='ingest'`` (opt-in), conversations whose audio lives in
+        GCS are grouped by folder and each folder is ingested with one
+        IngestConversations operation instead of one CreateConversation call per
+        conversation. That ingests every file in the folder from its audio alone,
+        ignoring the supplied transcripts and metadata, and reports per folder
+        rather than per conversation.
         
         Args:
-            conversations: List of formatted conversation data.
-            
-        Returns:
-            List of upload results.
+            conversations: Formatted conversation data; any iterable.
+            strategy: 'create' for per-conversation CreateConversation calls,
+                'ingest' for bulk ingestion by GCS folder. If None, uses
+                ccai.batch_upload_strategy.
+            force_unary: Always use per-conversation CreateConversation calls,
+                e.g. when retrying specific failed conversations.
+            
+        Yields:
+            Upload result dictionaries, in completion order. Bulk-ingested
+            folders yield one ingestion result per folder.
         """
-        processing_config = get_config_section('processing')
-        max_concurrent = processing_config.get('max_concurrent_files', 5)
-        
-        task_manager = AsyncTaskManager(max_concurrent_tasks=max_concurrent)
-        
-        # Create upload tasks
-        upload_tasks = [
-            self.upload_conversation(conversation) for conversation in conversations
-        ]
+        if strategy is None:
+            strategy = self._batch_upload_strategy
+        if strategy == 'ingest' and not force_unary:
+            # Grouping by folder needs the whole batch up front
+            async for result in self._batch_ingest_by_folder(list(conversations)):
+                yield result
+            return
+        
+        # CreateConversation is quota-limited per region; the worker count caps
+        # in-flight requests so the batch runs near the limit without 429s.
+        worker_count = self._max_concurrent_uploads
+        pending: asyncio.Queue = asyncio.Queue(maxsize=worker_count * 2)
+        results: asyncio.Queue = asyncio.Queue()
+        worker_done = object()
+        
+        async def _stop_workers() -> None:
+            for _ in range(worker_count):
+                await pending.put(None)
+        
+        async def _produce() -> None:
+            try:
+                for conversation in conversations:
+                    await pending.put(conversation)
+            except Exception:
+                # Let the workers drain what was queued; the caller sees the error
+                await _stop_workers()
+                raise
+            await _stop_workers()
         
-        # Execute uploads concurrently
-        results = await task_manager.run_tasks(upload_tasks)
+        async def _work() -> None:
+            try:
+                while True:
+                    conversation = await pending.get()
+                    if conversation is None:
+                        break
+                    try:
+                        result = await self.upload_conversation(conversation)
+                    except Exception as e:
+                        conversation_id = _resource_id(conversation.get('name', ''))
+                        self.logger.error("Upload task raised",
+                                        conversation_id=conversation_id, error=str(e))
+                        result = {'success': False, 'conversation_id': conversation_id,
+                                  'error': str(e)}
+                    results.put_nowait(result)
+                    if self._upload_politeness_seconds:
+                        await asyncio.sleep(self._upload_politeness_seconds)
+            finally:
+                results.put_nowait(worker_done)
+        
+        producer = asyncio.ensure_future(_produce())
+        workers = [asyncio.ensure_future(_work()) for _ in range(worker_count)]
+        successful_uploads = 0
+        failed_uploads = 0
+        try:
+            finished_workers = 0
+            while finished_workers < worker_count:
+                result = await results.get()
+                if result is worker_done:
+                    finished_workers += 1
+                    continue
+                if result.get('success', False):
+                    successful_uploads += 1
+                else:
+                    failed_uploads += 1
+                yield result
+            # Surface errors raised while iterating the input
+            await producer
+        finally:
+            # Don't leave uploads running if the consumer stops early
+            for task in (producer, *workers):
+                if not task.done():
+                    task.cancel()
         
         # Log summary
-        successful_uploads = sum(1 for result in results if result.get('success', False))
-        failed_uploads = len(results) - successful_uploads
-        
         self.logger.info("Batch upload completed",
-                        total_conversations=len(conversations),
+                        total_conversations=successful_uploads + failed_uploads,
                         successful_uploads=successful_uploads,
                         failed_uploads=failed_uploads)
+    
+    async def _batch_ingest_by_folder(self, conversations: List[Dict[str, Any]]) -> AsyncIterator[Dict[str, Any]]:
+        """Bulk-ingest conversations grouped by the GCS folder holding their audio.
+        
+        Small batches, and conversations without an audio object inside a GCS
+        folder, fall back to CreateConversation since LRO startup cost
+        dominates for them; root-level objects are never ingested by folder,
+        as that would ingest the whole bucket. Note that
+        IngestConversations processes every file in a folder, not only the ones
+        passed in; previously ingested files are skipped by the API.
+        
+        Args:
+            conversations: List of formatted conversation data.
+            
+        Yields:
+            One ingestion result per folder in completion order, then
+            per-conversation upload results for any fallback conversations.
+        """
+        folders: Dict[str, int] = {}
+        fallback = []
+        for conversation in conversations:
+            audio_uri = self._get_audio_uri(conversation)
+            folder = self._audio_folder(audio_uri) if audio_uri else None
+            if folder:
+                folders[folder] = folders.get(folder, 0) + 1
+            else:
+                fallback.append(conversation)
+        
+        if len(conversations) - len(fallback) < self._ingest_batch_threshold:
+            self.logger.info("Batch below bulk ingestion threshold, using CreateConversation",
+                           total_conversations=len(conversations),
+                           threshold=self._ingest_batch_threshold)
+            async for result in self.batch_upload_conversations(conversations, force_unary=True):
+                yield result
+            return
+        
+        # Folders are ingested as independent operations, so one failing or
+        # timing out doesn't lose the others. CCAI runs one bulk ingest per
+        # region at a time, so each folder holds a slot from submission until
+        # its operation completes; with the default ccai.max_concurrent_ingests
+        # of 1 the folders are ingested one after another.
+        folder_slots = asyncio.Semaphore(self._max_concurrent_ingests)
+        
+        async def ingest_folder(folder: str) -> Dict[str, Any]:
+            async with folder_slots:
+                return await self.ingest_conversations_from_gcs(folder)
+        
+        for folder, count in folders.items():
+            self.logger.info("Bulk ingesting GCS folder", bucket_uri=folder, conversations=count)
+        tasks = [asyncio.ensure_future(ingest_folder(folder)) for folder in folders]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+        
+        if fallback:
+            async for result in self.batch_upload_conversations(fallback, force_unary=True):
+                yield result
+    
+    @staticmethod
+    def _audio_folder(audio_uri: str) -> Optional[str]:
+        """Get the GCS folder holding an audio object, for folder ingestion.
         
-        return results
+        Args:
+            audio_uri: gs:// audio URI.
+            
+        Returns:
+            Folder URI with a trailing slash, or None if the URI can't be
+            parsed or the object sits at the bucket root.
+        """
+        bucket, _, object_name = audio_uri[len('gs://'):].partition('/')
+        folder, separator, file_name = object_name.rpartition('/')
+        # A bucket-root object has no folder of its own; its "folder" would be
+        # the whole bucket
+        if not (bucket and separator and folder and file_name):
+            return None
+        return f"gs://{bucket}/{folder}/"
+    
+    @staticmethod
+    def _get_audio_uri(conversation_data: Dict[str, Any]) -> Optional[str]:
+        """Get the GCS audio URI of formatted conversation data, if any.
+        
+        Args:
+            conversation_data: Formatted conversation data.
+            
+        Returns:
+            gs:// audio URI, or None.
+        """
+        data_source = conversation_data.get('data_source') or {}
+        audio_uri = (data_source.get('gcs_source') or {}).get('audio_uri')
+        if not audio_uri:
+            audio_uri = (conversation_data.get('transcription') or {}).get('gcs_uri')
+        if audio_uri and audio_uri.startswith('gs://'):
+            return audio_uri
+        return None
+    
+    async def batch_upload_conversations_list(self, conversations: Iterable[Dict[str, Any]],
+                                              strategy: Optional[Literal['create', 'ingest']] = None,
+                                              force_unary: bool = False) -> List[Dict[str, Any]]:
+        """Upload multiple conversations concurrently and collect all results.
+        
+        Args:
+            conversations: List of formatted conversation data.
+            strategy: See batch_upload_conversations.
+            force_unary: See batch_upload_conversations.
+            
+        Returns:
+            List of upload results, in completion order.
+        """
+        return [result async for result in self.batch_upload_conversations(
+            conversations, strategy=strategy, force_unary=force_unary)]
     
     async def ingest_conversations_from_gcs(self, bucket_uri: str, sample_size: Optional[int] = None) -> Dict[str, Any]:
         """Use the IngestConversations API to directly ingest audio files from GCS.
@@ -560,58 +1602,51 @@ class CCAIUploader(LoggerMixin):
                             bucket_object_type=gcs_source.bucket_object_type.name,
                             note="API handles server-side file discovery and processing")
             
-            # Create transcript object configuration for audio processing
-            transcript_object_config = self._create_transcript_object_config()
-            
-            # Create conversation configuration
-            conversation_config = self._create_conversation_config()
-            
-            # Create speech configuration for custom recognizer
-            speech_config = self._create_speech_config()
-            
-            # Create ingest request with required fields per official documentation
-            request = IngestConversationsRequest(
-                parent=self.parent,
-                gcs_source=gcs_source,
-                transcript_object_config=transcript_object_config,
-                conversation_config=conversation_config
-            )
+            # Required fields per official documentation; the static configs are
+            # prebuilt per uploader (see refresh_configs)
+            request_fields = {
+                'parent': self.parent,
+                'gcs_source': gcs_source,
+                'transcript_object_config': self._transcript_object_config,
+                'conversation_config': self._conversation_config,
+            }
             
             # Add speech config if custom recognizer is specified
+            speech_config = self._speech_config
             if speech_config:
-                request.speech_config = speech_config
+                request_fields['speech_config'] = speech_config
             
             # Add redaction config at the correct IngestConversationsRequest level (not ConversationConfig)
-            redaction_config = self._create_redaction_config_for_request()
+            redaction_config = self._redaction_config
             if redaction_config:
-                request.redaction_config = redaction_config
+                request_fields['redaction_config'] = redaction_config
             
             # Add sample_size if specified (for testing/quota management)
             if sample_size:
-                request.sample_size = sample_size
+                request_fields['sample_size'] = sample_size
                 self.logger.info("Sample size limit applied for testing/quota management",
                                sample_size=sample_size)
             
+            # Build the request in one constructor call
+            request = IngestConversationsRequest(**request_fields)
+            
             # Debug: Log the request details per official API documentation
             self.logger.info("IngestConversationsRequest details (official API structure)",
                             parent=request.parent,
                             bucket_uri=request.gcs_source.bucket_uri,
                             bucket_object_type=request.gcs_source.bucket_object_type.name,
                             medium=request.transcript_object_config.medium.name,
-                            speech_recognizer=getattr(request.speech_config, 'speech_recognizer', 'default') if hasattr(request, 'speech_config') else 'default',
+                            speech_recognizer=speech_config.speech_recognizer if speech_config else 'default',
                             agent_channel=request.conversation_config.agent_channel,
                             customer_channel=request.conversation_config.customer_channel,
-                            redaction_config=hasattr(request, 'redaction_config'),
-                            sample_size=getattr(request, 'sample_size', 'none'),
+                            redaction_config=bool(redaction_config),
+                            sample_size=sample_size or 'none',
                             note="API will process ALL files in bucket location")
             
             # Start the ingestion operation with retry logic for quota errors
             operation = await self._start_ingestion_with_retry(request)
             
-            # Get operation name - handle both Operation and LRO types
-            operation_name = getattr(operation, 'name', None)
-            if not operation_name:
-                operation_name = f"operation-{id(operation)}"  # Fallback to object ID
+            operation_name = self._get_operation_name(operation)
             
             self.logger.info("Ingestion operation started successfully", 
                            operation_name=operation_name,
@@ -687,28 +1722,43 @@ class CCAIUploader(LoggerMixin):
                 'sample_size': sample_size
             }
     
-    async def _start_ingestion_with_retry(self, request, max_retries: int = 3, initial_delay: int = 60):
+    async def _start_ingestion_with_retry(self, request, max_retries: int = 3, initial_delay: int = 60,
+                                          total_deadline: Optional[float] = None):
         """Start ingestion operation with retry logic for quota errors.
         
         Args:
             request: The IngestConversationsRequest
             max_retries: Maximum number of retry attempts
             initial_delay: Initial delay in seconds before first retry
+            total_deadline: Overall time budget in seconds for all attempts and
+                backoff sleeps. If None, uses ccai.ingest_total_deadline_seconds.
             
         Returns:
             The operation object from successful ingestion start
             
         Raises:
-            Exception: If all retries are exhausted
+            CircuitOpenError: If the circuit breaker is open.
+            Exception: If all retries are exhausted or the deadline passes
         """
+        if total_deadline is None:
+            total_deadline = self._ingest_total_deadline
+        deadline = time.monotonic() + total_deadline
+        
         for attempt in range(max_retries + 1):
+            # Fails fast with CircuitOpenError (not retried) while quota is known exhausted
+            self._breaker.before_call()
+            outcome_recorded = False
             try:
                 self.logger.info("Attempting to start ingestion operation", 
                                attempt=attempt + 1, 
                                max_attempts=max_retries + 1)
                 
-                operation = await sync_to_async(self.client.ingest_conversations)(request)
+                ingest_semaphore, _ = self._get_ingest_semaphores()
+                async with ingest_semaphore:
+                    operation = await self._next_async_client().ingest_conversations(request=request)
                 
+                self._breaker.on_success()
+                outcome_recorded = True
                 self.logger.info("Ingestion operation started successfully",
                                attempt=attempt + 1)
                 return operation
@@ -717,23 +1767,45 @@ class CCAIUploader(LoggerMixin):
                 error_code = getattr(e, 'code', None)
                 error_msg = str(e)
                 
-                # Check if this is a quota/rate limit error
+                # Classify by exception type; the one message check covers the
+                # concurrent bulk ingest limit, which isn't always a 429
                 is_quota_error = (
-                    error_code == 429 or 
-                    "ResourceExhausted" in str(type(e).__name__) or
-                    "concurrent bulk ingest" in error_msg.lower() or
-                    "quota" in error_msg.lower() or
-                    "rate limit" in error_msg.lower()
+                    isinstance(e, _QUOTA_ERRORS) or
+                    error_code == 429 or
+                    "concurrent bulk ingest" in error_msg.lower()
                 )
                 
+                # The breaker tracks quota exhaustion only; any other answer
+                # shows the quota isn't what's failing
+                if is_quota_error:
+                    self._breaker.on_failure()
+                else:
+                    self._breaker.on_success()
+                outcome_recorded = True
+                
                 if is_quota_error and attempt < max_retries:
-                    # Calculate delay with exponential backoff
-                    delay = initial_delay * (2 ** attempt)
+                    # Jittered exponential backoff so workers sharing a quota
+                    # don't wake up and collide again at the same instant
+                    backoff_cap = self._retry_max_delay
+                    delay = _backoff_delay(initial_delay, attempt, backoff_cap, self._retry_jitter)
+                    
+                    # Give up early rather than sleep past the overall deadline
+                    remaining_budget = deadline - time.monotonic()
+                    if delay >= remaining_budget:
+                        self.logger.error("Ingestion retry deadline exceeded",
+                                        attempt=attempt + 1,
+                                        delay_seconds=round(delay, 2),
+                                        remaining_budget=round(max(remaining_budget, 0), 2),
+                                        error=error_msg)
+                        raise e
                     
                     self.logger.warning("Quota/rate limit hit, retrying after delay",
                                       attempt=attempt + 1,
                                       max_attempts=max_retries + 1,
-                                      delay_seconds=delay,
+                                      delay_seconds=round(delay, 2),
+                                      backoff_cap=backoff_cap,
+                                      jitter=self._retry_jitter,
+                                      remaining_budget=round(remaining_budget, 2),
                                       error=error_msg)
                     
                     # Wait before retrying
@@ -746,6 +1818,11 @@ class CCAIUploader(LoggerMixin):
                                         final_attempt=attempt + 1,
                                         error=error_msg)
                     raise e
+            finally:
+                # A cancelled call (CancelledError skips the handler above) must
+                # not keep a half-open probe slot, or the breaker never closes
+                if not outcome_recorded:
+                    self._breaker.release()
         
         # This should never be reached, but just in case
         raise Exception("Unexpected end of retry loop")
@@ -765,55 +1842,19 @@ class CCAIUploader(LoggerMixin):
         if not gcs_uri.startswith('gs://'):
             raise ValueError(f"Invalid GCS URI: {gcs_uri}")
         
-        parts = gcs_uri.split('/')
-        if len(parts) < 4:
+        bucket_name, separator, object_path = gcs_uri[len('gs://'):].partition('/')
+        if not separator:
             raise ValueError(f"Invalid GCS URI format: {gcs_uri}")
         
         # For IngestConversations API, we need the folder path, not just the bucket
         # Extract bucket and folder path: gs://bucket-name/folder/
-        bucket_name = parts[2]
-        folder_path = '/'.join(parts[3:-1])  # Exclude the filename
+        folder_path = object_path.rpartition('/')[0]  # Exclude the filename
         
         if folder_path:
             return f"gs://{bucket_name}/{folder_path}/"
         else:
             return f"gs://{bucket_name}/"
     
-    def _create_conversation_for_ingestion(self, gcs_uri: str) -> Conversation:
-        """Create a conversation object for direct ingestion from GCS.
-        
-        Args:
-            gcs_uri: GCS URI of the audio file.
-            
-        Returns:
-            Conversation object configured for ingestion.
-        """
-        from google.cloud.contact_center_insights_v1.types import ConversationDataSource, GcsSource
-        
-        conversation = Conversation()
-        conversation.medium = Conversation.Medium.PHONE_CALL
-        conversation.language_code = "en-US"
-        
-        # Set TTL (time to live)
-        ttl_days = self.ccai_config.get('conversation_ttl_days', 365)
-        expire_time = datetime.utcnow() + timedelta(days=ttl_days)
-        conversation.expire_time = expire_time
-        
-        # Create data source with GCS audio URI
-        data_source = ConversationDataSource()
-        gcs_source = GcsSource()
-        gcs_source.audio_uri = gcs_uri
-        data_source.gcs_source = gcs_source
-        conversation.data_source = data_source
-        
-        # Add call metadata
-        call_metadata = Conversation.CallMetadata()
-        call_metadata.customer_channel = 1  # Channel 1 for customer
-        call_metadata.agent_channel = 2     # Channel 2 for agent
-        conversation.call_metadata = call_metadata
-        
-        return conversation
-    
     def _create_conversation_config(self) -> IngestConversationsRequest.ConversationConfig:
         """Create conversation configuration for ingestion.
         
@@ -823,9 +1864,9 @@ class CCAIUploader(LoggerMixin):
         config = IngestConversationsRequest.ConversationConfig()
         
         # According to the official documentation, agent_channel and customer_channel are required
-        # Use 1-based indexing (1 for customer, 2 for agent) as this is most common
-        config.customer_channel = 1
-        config.agent_channel = 2
+        # Defaults use 1-based indexing (1 for customer, 2 for agent) as this is most common
+        config.customer_channel = self._customer_channel
+        config.agent_channel = self._agent_channel
         
         # Note: redaction_config should be set at IngestConversationsRequest level, not ConversationConfig
         # See: https://cloud.google.com/python/docs/reference/contactcenterinsights/latest/google.cloud.contact_center_insights_v1.types.RedactionConfig
@@ -843,8 +1884,6 @@ class CCAIUploader(LoggerMixin):
         Returns:
             TranscriptObjectConfig object for the ingestion request.
         """
-        from google.cloud.contact_center_insights_v1.types import Conversation
-        
         config = IngestConversationsRequest.TranscriptObjectConfig()
         
         # Set the medium type to PHONE_CALL for audio files (most common)
@@ -865,8 +1904,6 @@ class CCAIUploader(LoggerMixin):
         Returns:
             RedactionConfig object.
         """
-        from google.cloud.contact_center_insights_v1.types import RedactionConfig
-        
         config = RedactionConfig()
         
         # Set deidentify template for redaction
@@ -888,6 +1925,9 @@ class CCAIUploader(LoggerMixin):
     def _create_redaction_config_for_request(self) -> Any:
         """Create redaction configuration for IngestConversationsRequest.
         
+        Built once per uploader by refresh_configs; ingestion requests reuse
+        the cached config instead of re-reading the DLP settings.
+        
         Returns:
             RedactionConfig object or None if no DLP configuration found.
         """
@@ -905,14 +1945,12 @@ class CCAIUploader(LoggerMixin):
                 redaction_config_data = {}
                 
                 if identify_template_id:
-                    redaction_config_data['inspect_template'] = (
-                        f"projects/{self.project_id}/locations/{dlp_location}/inspectTemplates/{identify_template_id}"
-                    )
+                    redaction_config_data['inspect_template'] = _INSPECT_TEMPLATE_PATH.format(
+                        project=self.project_id, location=dlp_location, template=identify_template_id)
                     
                 if deidentify_template_id:
-                    redaction_config_data['deidentify_template'] = (
-                        f"projects/{self.project_id}/locations/{dlp_location}/deidentifyTemplates/{deidentify_template_id}"
-                    )
+                    redaction_config_data['deidentify_template'] = _DEIDENTIFY_TEMPLATE_PATH.format(
+                        project=self.project_id, location=dlp_location, template=deidentify_template_id)
                     
                 config = self._create_redaction_config(redaction_config_data)
                 self.logger.debug("Added DLP redaction config to IngestConversationsRequest", 
@@ -940,8 +1978,6 @@ class CCAIUploader(LoggerMixin):
             self.logger.debug("No recognizer path specified, using default speech settings")
             return None
             
-        from google.cloud.contact_center_insights_v1.types import SpeechConfig
-        
         speech_config = SpeechConfig()
         speech_config.speech_recognizer = self.recognizer_path
         
@@ -956,17 +1992,23 @@ class CCAIUploader(LoggerMixin):
         Raises:
             ValueError: If recognizer validation fails.
         """
+        if speech_v1 is None:
+            self.logger.warning("Speech client not available for recognizer validation",
+                              recognizer_path=self.recognizer_path)
+            return
+        
         try:
             # Try to get recognizer details (this requires Speech API client)
-            from google.cloud import speech_v1
-            
-            speech_client = speech_v1.SpeechClient()
+            # Reuse one client so repeat validations skip channel setup and TLS
+            if self._speech_client is None:
+                self._speech_client = speech_v1.SpeechClient()
+            speech_client = self._speech_client
             
             # The recognizer path format should be: projects/{project_number}/locations/{location}/recognizers/{recognizer_id}
             try:
                 # Try to get recognizer (this will fail if it doesn't exist or we don't have permissions)
                 recognizer_request = speech_v1.GetRecognizerRequest(name=self.recognizer_path)
-                recognizer = await sync_to_async(speech_client.get_recognizer)(recognizer_request)
+                recognizer = await sync_to_async(speech_client.get_recognizer, self._executor)(recognizer_request)
                 
                 self.logger.info("Recognizer validation successful",
                                recognizer_name=recognizer.name,
@@ -985,14 +2027,60 @@ class CCAIUploader(LoggerMixin):
                                   validation_error=str(speech_error),
                                   note="This may be normal if using a different recognizer setup")
                 
-        except ImportError:
-            self.logger.warning("Speech client not available for recognizer validation",
-                              recognizer_path=self.recognizer_path)
         except Exception as e:
             self.logger.warning("Recognizer validation failed (proceeding anyway)",
                               recognizer_path=self.recognizer_path,
                               error=str(e))
     
+    async def _wait_for_operation(self, operation, timeout_seconds: float) -> Any:
+        """Wait for a long-running operation without pinning a worker thread.
+        
+        Polls the operation status with capped, jittered exponential backoff,
+        sleeping on the event loop between polls; the status RPCs are native
+        asyncio calls. Ingestion progress from the refreshed operation metadata
+        is logged whenever it changes.
+        
+        Args:
+            operation: The AsyncOperation to wait for.
+            timeout_seconds: Maximum time to wait in seconds.
+            
+        Returns:
+            The operation result.
+            
+        Raises:
+            asyncio.TimeoutError: If the operation does not finish in time.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout_seconds
+        delay = _LRO_POLL_INITIAL_DELAY
+        last_processed = None
+        
+        while not await operation.done():
+            metadata = operation.metadata
+            if isinstance(metadata, IngestConversationsMetadata):
+                stats = IngestConversationsMetadata.pb(metadata).ingest_conversations_stats
+                if stats.processed_object_count != last_processed:
+                    last_processed = stats.processed_object_count
+                    self.logger.info("Ingestion in progress",
+                                   operation_name=self._get_operation_name(operation),
+                                   total_processed=stats.processed_object_count,
+                                   successful_ingests=stats.successful_ingest_count,
+                                   duplicates_skipped=stats.duplicates_skipped_count,
+                                   failed_ingests=stats.failed_ingest_count)
+            
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                raise asyncio.TimeoutError(
+                    f"Operation did not complete within {timeout_seconds} seconds"
+                )
+            
+            # Jitter keeps concurrent waiters from polling in lockstep
+            await asyncio.sleep(min(delay + random.uniform(0, 1), remaining))
+            delay = min(delay * 2, _LRO_POLL_MAX_DELAY)
+        
+        # The operation is done, so result() returns (or raises) immediately
+        return await operation.result()
+    
     async def _monitor_ingestion_operation(self, operation) -> Dict[str, Any]:
         """Monitor the ingestion operation until completion.
         
@@ -1002,79 +2090,48 @@ class CCAIUploader(LoggerMixin):
         Returns:
             Operation result with completion status.
         """
-        # Get operation name safely
-        operation_name = getattr(operation, 'name', str(operation))
+        operation_name = self._get_operation_name(operation)
         
         self.logger.info("Monitoring ingestion operation", operation_name=operation_name)
         
         try:
             # Wait for operation to complete with timeout
             timeout_seconds = 900  # 15 minutes
-            result = await sync_to_async(operation.result)(timeout=timeout_seconds)
+            _, lro_semaphore = self._get_ingest_semaphores()
+            async with lro_semaphore:
+                result = await self._wait_for_operation(operation, timeout_seconds)
             
-            # Extract operation metadata
-            metadata = getattr(operation, 'metadata', None)
+            # Extract operation metadata: convert it to a dict once, then index it
+            metadata = operation.metadata
             if metadata:
                 try:
-                    # Try to access metadata directly without ParseFromString
-                    # The metadata might already be parsed as an object
-                    if hasattr(metadata, 'ingest_conversations_stats'):
-                        # Direct access to stats
-                        stats = metadata.ingest_conversations_stats
-                        
-                        ingest_result = {
-                            'success': True,
-                            'operation_name': operation_name,
-                            'conversations_ingested': stats.successful_ingest_count,
-                            'failed_conversations': stats.failed_ingest_count,
-                            'duplicate_conversations': stats.duplicates_skipped_count,
-                            'total_processed': stats.processed_object_count,
-                            'partial_errors': [],
-                            'lro_completed': True,
-                            'error': None
-                        }
-                        
-                        self.logger.info("Parsed operation metadata successfully (direct access)",
-                                       total_processed=stats.processed_object_count,
-                                       successful_ingests=stats.successful_ingest_count,
-                                       duplicates_skipped=stats.duplicates_skipped_count,
-                                       failed_ingests=stats.failed_ingest_count)
-                        
-                    else:
-                        # Try alternative parsing methods
-                        # Check if metadata has the stats as attributes
-                        successful_count = getattr(metadata, 'successful_ingest_count', 0)
-                        failed_count = getattr(metadata, 'failed_ingest_count', 0)
-                        duplicates_count = getattr(metadata, 'duplicates_skipped_count', 0)
-                        processed_count = getattr(metadata, 'processed_object_count', 0)
-                        
-                        # If we got any non-zero values, use them
-                        if any([successful_count, failed_count, duplicates_count, processed_count]):
-                            ingest_result = {
-                                'success': True,
-                                'operation_name': operation_name,
-                                'conversations_ingested': successful_count,
-                                'failed_conversations': failed_count,
-                                'duplicate_conversations': duplicates_count,
-                                'total_processed': processed_count,
-                                'partial_errors': [],
-                                'lro_completed': True,
-                                'error': None
-                            }
-                            
-                            self.logger.info("Parsed operation metadata successfully (attribute access)",
-                                           total_processed=processed_count,
-                                           successful_ingests=successful_count,
-                                           duplicates_skipped=duplicates_count,
-                                           failed_ingests=failed_count)
-                        else:
-                            # Log available metadata fields for debugging
-                            metadata_fields = [attr for attr in dir(metadata) if not attr.startswith('_')]
-                            self.logger.debug("Available metadata fields", fields=metadata_fields)
-                            
-                            # Last resort: try to parse the operation result itself
-                            # Sometimes the LRO result contains the statistics
-                            raise Exception("Could not find stats in metadata, trying fallback")
+                    if isinstance(metadata, IngestConversationsMetadata):
+                        metadata = IngestConversationsMetadata.pb(metadata)
+                    metadata_dict = MessageToDict(metadata, preserving_proto_field_name=True)
+                    # Zero counts are omitted by MessageToDict, hence the defaults
+                    stats = metadata_dict.get('ingest_conversations_stats') or metadata_dict
+                    successful_count = stats.get('successful_ingest_count', 0)
+                    failed_count = stats.get('failed_ingest_count', 0)
+                    duplicates_count = stats.get('duplicates_skipped_count', 0)
+                    processed_count = stats.get('processed_object_count', 0)
+                    
+                    ingest_result = {
+                        'success': True,
+                        'operation_name': operation_name,
+                        'conversations_ingested': successful_count,
+                        'failed_conversations': failed_count,
+                        'duplicate_conversations': duplicates_count,
+                        'total_processed': processed_count,
+                        'partial_errors': [],
+                        'lro_completed': True,
+                        'error': None
+                    }
+                    
+                    self.logger.info("Parsed operation metadata successfully",
+                                   total_processed=processed_count,
+                                   successful_ingests=successful_count,
+                                   duplicates_skipped=duplicates_count,
+                                   failed_ingests=failed_count)
                     
                 except Exception as metadata_error:
                     self.logger.warning("Failed to parse operation metadata", 
@@ -1117,12 +2174,15 @@ class CCAIUploader(LoggerMixin):
             if "already exist" in error_msg and "were skipped" in error_msg:
                 # Parse the 409 error message for duplicate files
                 # Example: "0 failed and 2 were skipped as they already exist"
-                import re
-                skipped_match = re.search(r'(\d+) were skipped as they already exist', error_msg)
-                failed_match = re.search(r'(\d+) failed', error_msg)
-                
-                skipped_count = int(skipped_match.group(1)) if skipped_match else 0
-                failed_count = int(failed_match.group(1)) if failed_match else 0
+                summary_match = _DEDUP_SUMMARY_RE.search(error_msg)
+                if summary_match:
+                    failed_count = int(summary_match.group('failed'))
+                    skipped_count = int(summary_match.group('skipped'))
+                else:
+                    skipped_match = _SKIPPED_RE.search(error_msg)
+                    failed_match = _FAILED_RE.search(error_msg)
+                    skipped_count = int(skipped_match.group(1)) if skipped_match else 0
+                    failed_count = int(failed_match.group(1)) if failed_match else 0
                 
                 self.logger.info("All files already exist - successful deduplication",
                                operation_name=operation_name,
@@ -1154,80 +2214,91 @@ class CCAIUploader(LoggerMixin):
                 'lro_completed': False,
                 'error': error_msg
             }
-        """Use the IngestConversations API for bulk upload.
+    
+    async def check_conversation_exists(self, conversation_id: str) -> bool:
+        """Check if a conversation already exists in CCAI Insights.
         
         Args:
-            conversations: List of formatted conversation data.
+            conversation_id: Conversation ID to check.
             
         Returns:
-            Bulk ingest operation result.
+            True if conversation exists, False otherwise.
+            
+        Raises:
+            google.api_core.exceptions.GoogleAPICallError: For failures other
+                than NotFound (e.g. permission or transient errors), which
+                would otherwise be misread as "doesn't exist".
         """
-        self.logger.info("Starting bulk conversation ingest", count=len(conversations))
-        
         try:
-            # Prepare conversation objects
-            conversation_objects = []
-            for conv_data in conversations:
-                conversation = self._create_conversation_object(conv_data)
-                conversation_objects.append(conversation)
-            
-            # Create ingest request
-            request = IngestConversationsRequest(
-                parent=self.parent,
-                conversations=conversation_objects
-            )
-            
-            # Perform bulk ingest
-            operation = await sync_to_async(self.client.ingest_conversations)(request)
-            
-            # Wait for operation to complete
-            result = await sync_to_async(operation.result)(timeout=600)  # 10 minute timeout
-            
-            ingest_result = {
-                'success': True,
-                'operation_name': operation.name,
-                'conversations_ingested': len(conversations),
-                'ingest_statistics': {
-                    'processed_conversations_count': len(conversations),
-                    'duplicated_conversations_count': 0,  # Would be in actual response
-                    'failed_conversations_count': 0       # Would be in actual response
-                },
-                'error': None
-            }
-            
-            self.logger.info("Bulk ingest completed successfully",
-                           operation_name=operation.name,
-                           conversations_count=len(conversations))
-            
-            return ingest_result
-            
-        except Exception as e:
-            error_msg = str(e)
-            self.logger.error("Bulk ingest failed", error=error_msg)
+            return conversation_id in await self.which_exist([conversation_id])
+        except core_exceptions.NotFound:
+            return False
+    
+    async def which_exist(self, conversation_ids: List[str]) -> Set[str]:
+        """Find which conversations already exist in CCAI Insights.
+        
+        Uses ListConversations with a server-side filter so a batch of IDs costs
+        one RPC per page instead of one GetConversation RPC per ID.
+        
+        Args:
+            conversation_ids: Conversation IDs to check.
             
-            return {
-                'success': False,
-                'operation_name': None,
-                'conversations_ingested': 0,
-                'ingest_statistics': None,
-                'error': error_msg
-            }
+        Returns:
+            Set of the given conversation IDs that exist.
+        """
+        unique_ids = list(dict.fromkeys(conversation_ids))
+        
+        # Conversations can't stop existing mid-batch, so known hits skip the RPC
+        existing_ids = {conversation_id for conversation_id in unique_ids
+                        if conversation_id in self._exists_cache}
+        unknown_ids = [conversation_id for conversation_id in unique_ids
+                       if conversation_id not in existing_ids]
+        
+        for start in range(0, len(unknown_ids), _EXISTS_FILTER_BATCH_SIZE):
+            id_batch = unknown_ids[start:start + _EXISTS_FILTER_BATCH_SIZE]
+            existing_ids.update(await self._list_existing_conversation_ids(id_batch))
+        
+        self._remember_existing(existing_ids)
+        
+        self.logger.debug("Checked conversation existence",
+                         requested=len(unique_ids),
+                         cached=len(unique_ids) - len(unknown_ids),
+                         existing=len(existing_ids))
+        
+        return existing_ids
     
-    async def check_conversation_exists(self, conversation_id: str) -> bool:
-        """Check if a conversation already exists in CCAI Insights.
+    def _remember_existing(self, conversation_ids: Iterable[str]) -> None:
+        """Record conversation IDs as existing in the LRU existence cache.
         
         Args:
-            conversation_id: Conversation ID to check.
+            conversation_ids: Conversation IDs known to exist.
+        """
+        for conversation_id in conversation_ids:
+            self._exists_cache[conversation_id] = None
+            self._exists_cache.move_to_end(conversation_id)
+        while len(self._exists_cache) > _EXISTS_CACHE_SIZE:
+            self._exists_cache.popitem(last=False)
+    
+    async def _list_existing_conversation_ids(self, conversation_ids: List[str]) -> Set[str]:
+        """List which of the given conversation IDs exist.
+        
+        Args:
+            conversation_ids: Conversation IDs to include in the filter.
             
         Returns:
-            True if conversation exists, False otherwise.
+            Set of conversation IDs returned by ListConversations.
         """
-        try:
-            conversation_name = f"{self.parent}/conversations/{conversation_id}"
-            await sync_to_async(self.client.get_conversation)(name=conversation_name)
-            return True
-        except Exception:
-            return False
+        request = ListConversationsRequest(
+            parent=self.parent,
+            filter=" OR ".join(f'conversation_id="{conversation_id}"'
+                               for conversation_id in conversation_ids),
+            page_size=_EXISTS_PAGE_SIZE,
+            view=ConversationView.BASIC
+        )
+        
+        # The pager fetches further pages transparently while iterating
+        pager = await self._next_async_client().list_conversations(request=request)
+        return {_resource_id(conversation.name) async for conversation in pager}
     
     def ingest_conversations_from_gcs_sync(self, bucket_uri: str, sample_size: Optional[int] = None) -> Dict[str, Any]:
         """Synchronous version of GCS audio ingestion.
@@ -1239,9 +2310,16 @@ class CCAIUploader(LoggerMixin):
         Returns:
             Ingest operation result.
         """
+        async def _run() -> Dict[str, Any]:
+            try:
+                return await self.ingest_conversations_from_gcs(bucket_uri, sample_size)
+            finally:
+                # The loop ends with this call, so its channels must not outlive it
+                await self._release_loop_state()
+        
         try:
             # Run the async version synchronously
-            return asyncio.run(self.ingest_conversations_from_gcs(bucket_uri, sample_size))
+            return asyncio.run(_run())
         except Exception as e:
             error_msg = str(e)
             self.logger.error("Synchronous ingestion failed", 
@@ -1258,53 +2336,6 @@ class CCAIUploader(LoggerMixin):
                 'bucket_uri': bucket_uri,
                 'sample_size': sample_size
             }
-        """Upload a single conversation to CCAI Insights synchronously.
-        
-        Args:
-            conversation_data: Formatted conversation data.
-            
-        Returns:
-            Upload result with success status and conversation details.
-        """
-        # Extract conversation ID from the data
-        conversation_id = conversation_data.get('metadata', {}).get('file_name', 'unknown')
-        
-        try:
-            # For now, let's just log and return success
-            # The CCAI API structure needs more investigation
-            self.logger.info("Would upload conversation to CCAI Insights",
-                           conversation_id=conversation_id,
-                           gcs_uri=conversation_data.get('transcription', {}).get('gcs_uri', ''))
-            
-            # Create a mock successful response
-            result = {
-                'success': True,
-                'conversation_id': conversation_id,
-                'conversation_name': f"{self.parent}/conversations/{conversation_id}",
-                'create_time': datetime.now().isoformat(),
-                'medium': 'PHONE_CALL',
-                'error': None
-            }
-            
-            self.logger.info("Conversation upload simulated successfully",
-                           conversation_id=conversation_id)
-            
-            return result
-            
-        except Exception as e:
-            error_msg = str(e)
-            self.logger.error("Failed to upload conversation",
-                            conversation_id=conversation_id,
-                            error=error_msg)
-            
-            return {
-                'success': False,
-                'conversation_id': conversation_id,
-                'conversation_name': None,
-                'create_time': None,
-                'medium': None,
-                'error': error_msg
-            }
     
     def _create_conversation_object_sync(self, conversation_data: Dict[str, Any]) -> 'contact_center_insights_v1.Conversation':
         """Create a CCAI Conversation object from the conversation data synchronously.
@@ -1319,20 +2350,14 @@ class CCAIUploader(LoggerMixin):
         gcs_uri = conversation_data.get('transcription', {}).get('gcs_uri', '')
         duration_seconds = conversation_data.get('transcription', {}).get('metadata', {}).get('total_duration', 0.0)
         
-        # Create the conversation with correct API structure
-        conversation = contact_center_insights_v1.Conversation()
-        conversation.medium = contact_center_insights_v1.Conversation.Medium.PHONE_CALL
-        
-        # Set the data source
-        data_source = contact_center_insights_v1.Conversation.ConversationDataSource()
-        gcs_source = contact_center_insights_v1.Conversation.ConversationDataSource.GcsSource()
-        gcs_source.audio_uri = gcs_uri
-        data_source.gcs_source = gcs_source
-        conversation.data_source = data_source
+        # Create the conversation with the data source in one constructor call
+        conversation = Conversation(
+            medium=_PHONE_CALL,
+            data_source=ConversationDataSource(gcs_source=GcsSource(audio_uri=gcs_uri))
+        )
         
         # Set duration if available
         if duration_seconds > 0:
-            from google.protobuf.duration_pb2 import Duration
             duration = Duration()
             duration.seconds = int(duration_seconds)
             duration.nanos = int((duration_seconds - int(duration_seconds)) * 1000000000)
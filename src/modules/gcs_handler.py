@@ -1,6 +1,7 @@
 """Google Cloud Storage handler for STT E2E Insights."""
 
 import asyncio
+import json
 from typing import List, Optional, Dict, Any
 from pathlib import Path
 import tempfile
@@ -11,7 +12,7 @@ from google.cloud.storage import Blob
 
 from utils.logger import LoggerMixin
 from utils.config_loader import get_config_section
-from utils.async_helpers import sync_to_async, async_retry
+from utils.async_helpers import AsyncTaskManager, sync_to_async, async_retry
 
 
 class GCSHandler(LoggerMixin):
@@ -38,6 +39,7 @@ class GCSHandler(LoggerMixin):
         self.input_folder = gcs_config.get('input_folder', '')
         self.output_folder = gcs_config.get('output_folder', '')
         self.file_prefix_filter = gcs_config.get('file_prefix_filter', 'merged')
+        self._input_uri_prefix = f"gs://{self.input_bucket_name}/"
         
         # Initialize GCS client
         self.client = storage.Client(project=self.project_id)
@@ -93,7 +95,7 @@ class GCSHandler(LoggerMixin):
         Returns:
             GCS URI (gs://bucket/path/to/file).
         """
-        return f"gs://{self.input_bucket_name}/{blob_name}"
+        return self._input_uri_prefix + blob_name
     
     def list_audio_files_sync(self) -> List[str]:
         """List audio files synchronously.
@@ -127,7 +129,7 @@ class GCSHandler(LoggerMixin):
         self.logger.info("Found matching audio files", count=len(matching_files))
         return matching_files
     
-    @async_retry(max_attempts=3, delay_seconds=2.0)
+    @async_retry(max_attempts=3, delay_seconds=2.0, jitter=True)
     async def download_file(self, blob_name: str, local_path: Optional[str] = None) -> str:
         """Download a file from GCS to local storage.
         
@@ -163,7 +165,7 @@ class GCSHandler(LoggerMixin):
         
         return local_path
     
-    @async_retry(max_attempts=3, delay_seconds=2.0)
+    @async_retry(max_attempts=3, delay_seconds=2.0, jitter=True)
     async def upload_file(self, local_path: str, blob_name: str, 
                          content_type: Optional[str] = None) -> str:
         """Upload a file from local storage to GCS.
@@ -200,7 +202,7 @@ class GCSHandler(LoggerMixin):
         
         return gcs_uri
     
-    @async_retry(max_attempts=3, delay_seconds=2.0)
+    @async_retry(max_attempts=3, delay_seconds=2.0, jitter=True)
     async def upload_json_data(self, data: Dict[Any, Any], blob_name: str) -> str:
         """Upload JSON data directly to GCS.
         
@@ -211,8 +213,6 @@ class GCSHandler(LoggerMixin):
         Returns:
             GCS URI of the uploaded file.
         """
-        import json
-        
         self.logger.debug("Uploading JSON data to GCS", blob_name=blob_name)
         
         # Add output folder prefix if specified
@@ -287,8 +287,6 @@ class GCSHandler(LoggerMixin):
         Returns:
             List of local file paths where files were downloaded.
         """
-        from ..utils.async_helpers import AsyncTaskManager
-        
         task_manager = AsyncTaskManager(max_concurrent_tasks=5)
         
         # Create download tasks
@@ -2,8 +2,9 @@
 
 import asyncio
 import aiofiles
+from concurrent.futures import Executor
 from typing import List, Callable, Any, Coroutine, TypeVar, Optional
-from tenacity import retry, stop_after_attempt, wait_exponential
+from tenacity import retry, stop_after_attempt, wait_exponential, wait_random_exponential
 import functools
 
 from .logger import get_logger
@@ -67,17 +68,28 @@ class AsyncTaskManager:
         return successful_results
 
 
-def async_retry(max_attempts: int = 3, delay_seconds: float = 2.0):
+def async_retry(max_attempts: int = 3, delay_seconds: float = 2.0,
+                max_delay_seconds: float = 60.0, jitter: bool = False):
     """Decorator for adding retry logic to async functions.
     
+    Retries wait with ``asyncio.sleep``, so other tasks keep running meanwhile.
+    
     Args:
         max_attempts: Maximum number of retry attempts.
         delay_seconds: Base delay between retries in seconds.
+        max_delay_seconds: Upper bound for a single delay.
+        jitter: Use full jitter (a random delay up to the exponential bound),
+            so concurrent callers failing together don't retry in lockstep.
     """
+    if jitter:
+        wait = wait_random_exponential(multiplier=delay_seconds, max=max_delay_seconds)
+    else:
+        wait = wait_exponential(multiplier=delay_seconds, min=1, max=max_delay_seconds)
+    
     def decorator(func: Callable) -> Callable:
         @retry(
             stop=stop_after_attempt(max_attempts),
-            wait=wait_exponential(multiplier=delay_seconds, min=1, max=60)
+            wait=wait
         )
         @functools.wraps(func)
         async def wrapper(*args, **kwargs):
@@ -124,19 +136,21 @@ async def write_file_async(file_path: str, content: bytes) -> None:
     logger.debug("File write completed", file_path=file_path)
 
 
-def sync_to_async(func: Callable) -> Callable:
+def sync_to_async(func: Callable, executor: Optional[Executor] = None) -> Callable:
     """Convert a synchronous function to async using thread pool.
     
     Args:
         func: Synchronous function to convert.
+        executor: Executor to run the function in. If None, uses the event
+            loop's default executor.
         
     Returns:
         Async wrapper function.
     """
     @functools.wraps(func)
     async def wrapper(*args, **kwargs):
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, functools.partial(func, *args, **kwargs))
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, functools.partial(func, *args, **kwargs))
     
     return wrapper
 
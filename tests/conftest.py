@@ -0,0 +1,10 @@
+"""Shared pytest configuration for the STT E2E Insights tests."""
+
+import sys
+from pathlib import Path
+
+# Modules import each other as top-level packages (e.g. ``utils.logger``), as
+# they do when the pipeline runs from src/
+src_path = Path(__file__).resolve().parent.parent / "src"
+if str(src_path) not in sys.path:
+    sys.path.insert(0, str(src_path))
@@ -0,0 +1,376 @@
+"""Tests for the CCAI uploader's conversation building, retries and batching."""
+
+import asyncio
+from collections import OrderedDict
+from datetime import datetime
+
+import pytest
+
+ccai_uploader = pytest.importorskip("modules.ccai_uploader")
+
+from google.api_core import exceptions as core_exceptions
+from google.protobuf.json_format import ParseDict
+from google.protobuf.timestamp_pb2 import Timestamp
+
+CCAIUploader = ccai_uploader.CCAIUploader
+Conversation = ccai_uploader.Conversation
+
+
+FORMATTED_CONVERSATION = {
+    'name': 'projects/test-project/locations/us-central1/conversations/call-001',
+    'medium': 'PHONE_CALL',
+    'language_code': 'en-US',
+    'expire_time': '2030-01-01T00:00:00Z',
+    'ttl': '86400s',
+    'data_source': {'gcs_source': {'audio_uri': 'gs://audio-bucket/calls/call-001.wav'}},
+    'call_metadata': {
+        'customer_channel': 1,
+        'agent_channel': 2,
+        'agent_id': 'agent-001',
+        'customer_id': 'customer-042',
+    },
+    'transcription': {
+        'gcs_uri': 'gs://audio-bucket/calls/call-001.wav',
+        'metadata': {'total_duration': 3.5},
+    },
+    'conversation_transcript': {
+        'transcript_segments': [
+            {
+                'text': 'Hello, how can I help?',
+                'confidence': 0.92,
+                'language_code': 'en-US',
+                'channel_tag': 2,
+                'segment_start_time': '0s',
+                'segment_end_time': '1.6s',
+                'segment_participant': {
+                    'role': 'HUMAN_AGENT',
+                    'obfuscated_external_user_id': 'agent-001',
+                },
+                'words': [
+                    {'word': 'Hello,', 'confidence': 0.95, 'start_offset': '0s', 'end_offset': '0.4s'},
+                    {'word': 'how', 'confidence': 0.9, 'start_offset': '0.4s', 'end_offset': '0.7s'},
+                    {'word': 'can', 'confidence': 0.91, 'start_offset': '0.7s', 'end_offset': '0.9s'},
+                    {'word': 'I', 'confidence': 0.93, 'start_offset': '0.9s', 'end_offset': '1s'},
+                    {'word': 'help?', 'confidence': 0.89, 'start_offset': '1s', 'end_offset': '1.6s'},
+                ],
+            },
+            {
+                'text': 'My bill is wrong.',
+                'confidence': 0.88,
+                'channel_tag': 1,
+                'segment_start_time': '1.8s',
+                'segment_end_time': '3.5s',
+                'segment_participant': {'role': 'END_USER'},
+                'words': [
+                    {'word': 'My', 'confidence': 0.9, 'start_offset': '1.8s', 'end_offset': '2s',
+                     'speaker_tag': 1},
+                    {'word': 'bill', 'confidence': 0.87, 'start_offset': '2s', 'end_offset': '2.5s'},
+                    {'word': 'is', 'confidence': 0.9, 'start_offset': '2.5s', 'end_offset': '2.8s'},
+                    {'word': 'wrong.', 'confidence': 0.85, 'start_offset': '2.8s', 'end_offset': '3.5s'},
+                ],
+            },
+        ]
+    },
+}
+
+
+@pytest.fixture
+def uploader():
+    """Uploader with the settings used below, built without config or API lookups."""
+    uploader = CCAIUploader.__new__(CCAIUploader)
+    uploader.project_id = 'test-project'
+    uploader.location = 'us-central1'
+    uploader.parent = 'projects/test-project/locations/us-central1'
+    uploader._create_max_attempts = 3
+    uploader._create_retry_delay = 0
+    uploader._max_concurrent_uploads = 2
+    uploader._upload_politeness_seconds = 0
+    uploader._batch_upload_strategy = 'create'
+    uploader._exists_cache = OrderedDict()
+    uploader._max_concurrent_ingests = 1
+    uploader._max_concurrent_lro_polls = 1
+    uploader._ingest_semaphores = None
+    uploader._ingest_semaphores_loop = None
+    uploader._ingest_total_deadline = 300
+    uploader._retry_max_delay = 600
+    uploader._retry_jitter = 'full'
+    return uploader
+
+
+class TestCircuitBreaker:
+    """Breaker state transitions."""
+
+    def test_opens_after_threshold_and_rejects_calls(self):
+        breaker = ccai_uploader._CCAIBreaker(('p', 'l'), failure_threshold=2, reset_seconds=60)
+
+        breaker.on_failure()
+        assert breaker.state == breaker.CLOSED
+        breaker.on_failure()
+        assert breaker.state == breaker.OPEN
+
+        with pytest.raises(ccai_uploader.CircuitOpenError):
+            breaker.before_call()
+
+    def test_half_open_admits_limited_probes(self):
+        breaker = ccai_uploader._CCAIBreaker(('p', 'l'), failure_threshold=1, reset_seconds=0)
+        breaker.on_failure()
+
+        breaker.before_call()
+        assert breaker.state == breaker.HALF_OPEN
+        with pytest.raises(ccai_uploader.CircuitOpenError):
+            breaker.before_call()
+
+        breaker.on_success()
+        assert breaker.state == breaker.CLOSED
+        breaker.before_call()
+
+    def test_failed_probe_reopens(self):
+        breaker = ccai_uploader._CCAIBreaker(('p', 'l'), failure_threshold=3, reset_seconds=0)
+        for _ in range(3):
+            breaker.on_failure()
+
+        breaker.before_call()
+        breaker.on_failure()
+        assert breaker.state == breaker.OPEN
+
+    def test_release_returns_probe_slot(self):
+        breaker = ccai_uploader._CCAIBreaker(('p', 'l'), failure_threshold=1, reset_seconds=0)
+        breaker.on_failure()
+
+        breaker.before_call()
+        breaker.release()
+        breaker.before_call()
+        assert breaker.state == breaker.HALF_OPEN
+
+    def test_cancelled_ingest_start_releases_probe_slot(self, uploader):
+        breaker = ccai_uploader._CCAIBreaker(('p', 'l'), failure_threshold=1, reset_seconds=0)
+        breaker.on_failure()
+        uploader._breaker = breaker
+
+        class HangingClient:
+            async def ingest_conversations(self, request):
+                await asyncio.Event().wait()
+
+        uploader._next_async_client = HangingClient
+
+        async def run():
+            task = asyncio.ensure_future(uploader._start_ingestion_with_retry(object()))
+            for _ in range(5):
+                await asyncio.sleep(0)
+            assert breaker.state == breaker.HALF_OPEN
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(run())
+
+        # The cancelled probe didn't keep its slot
+        breaker.before_call()
+
+
+class TestBatchUpload:
+    """Bounded worker pool behind batch_upload_conversations."""
+
+    def test_input_is_consumed_lazily(self, uploader):
+        produced = []
+
+        def conversations():
+            for i in range(100):
+                produced.append(i)
+                yield {'name': f'conversations/call-{i}'}
+
+        async def run():
+            gate = asyncio.Event()
+
+            async def upload(conversation):
+                await gate.wait()
+                return {'success': True, 'conversation_id': conversation['name']}
+
+            uploader.upload_conversation = upload
+            stream = uploader.batch_upload_conversations(conversations())
+            first = asyncio.ensure_future(stream.__anext__())
+            for _ in range(20):
+                await asyncio.sleep(0)
+
+            # Workers hold one each, the queue holds two per worker and the
+            # producer may be blocked on one more
+            workers = uploader._max_concurrent_uploads
+            assert len(produced) <= workers + 2 * workers + 1
+
+            gate.set()
+            return [await first] + [result async for result in stream]
+
+        results = asyncio.run(run())
+        assert len(results) == 100
+        assert all(result['success'] for result in results)
+
+    def test_raising_upload_reports_conversation_id(self, uploader):
+        async def upload(conversation):
+            raise RuntimeError("boom")
+
+        uploader.upload_conversation = upload
+
+        async def run():
+            return [result async for result in uploader.batch_upload_conversations(
+                [{'name': 'projects/p/locations/l/conversations/call-7'}])]
+
+        results = asyncio.run(run())
+        assert results == [{'success': False, 'conversation_id': 'call-7', 'error': 'boom'}]
+
+
+class TestDurationsAndTimestamps:
+    """Offset and timestamp parsing edge cases."""
+
+    @pytest.mark.parametrize("duration, expected", [
+        ('30s', (30, 0)),
+        ('2.5s', (2, 500000000)),
+        ('2.5', (2, 500000000)),
+        ('.25s', (0, 250000000)),
+        ('0.000000001s', (0, 1)),
+        ('-1.5s', (-1, -500000000)),
+        ('1e-3s', (0, 1000000)),
+        ('0.1234567891s', (0, 123456789)),
+    ])
+    def test_split_duration(self, duration, expected):
+        assert ccai_uploader._split_duration(duration) == expected
+
+    @pytest.mark.parametrize("value, expected_seconds", [
+        ('2024-01-01T00:00:00Z', 1704067200),
+        ('2024-01-01T02:00:00+02:00', 1704067200),
+        ('2024-01-01T00:00:00', 1704067200),
+        (datetime(2024, 1, 1), 1704067200),
+    ])
+    def test_parse_timestamp(self, uploader, value, expected_seconds):
+        assert uploader._parse_timestamp(value).seconds == expected_seconds
+
+    def test_parse_timestamp_keeps_fraction(self, uploader):
+        timestamp = uploader._parse_timestamp('2024-01-01T00:00:00.25Z')
+        assert (timestamp.seconds, timestamp.nanos) == (1704067200, 250000000)
+
+    def test_parse_timestamp_passes_through_messages(self, uploader):
+        timestamp = Timestamp(seconds=5)
+        assert uploader._parse_timestamp(timestamp) is timestamp
+
+    @pytest.mark.parametrize("value", [None, '', 'not a timestamp'])
+    def test_parse_timestamp_rejects(self, uploader, value):
+        assert uploader._parse_timestamp(value) is None
+
+
+class TestConversationBuilding:
+    """ParseDict fast path and field-by-field builders."""
+
+    def test_formatted_conversation_parses_without_fallback(self):
+        message_data = ccai_uploader._conversation_message_dict(FORMATTED_CONVERSATION)
+        ParseDict(message_data, Conversation.pb()())
+
+    def test_parse_and_builders_produce_same_message(self, uploader):
+        parsed = uploader._create_conversation_object(FORMATTED_CONVERSATION)
+        built = uploader._build_conversation_object(FORMATTED_CONVERSATION)
+
+        assert Conversation.pb(parsed) == Conversation.pb(built)
+
+    def test_built_conversation_fields(self, uploader):
+        conversation = uploader._create_conversation_object(FORMATTED_CONVERSATION)
+
+        assert conversation.medium == Conversation.Medium.PHONE_CALL
+        assert conversation.agent_id == 'agent-001'
+        assert conversation.call_metadata.agent_channel == 2
+        assert conversation.data_source.gcs_source.audio_uri == 'gs://audio-bucket/calls/call-001.wav'
+        assert conversation.expire_time.timestamp() == 1893456000
+        assert 'ttl' not in conversation
+        segments = conversation.transcript.transcript_segments
+        assert len(segments) == 2
+        assert segments[1].language_code == 'en-US'
+        assert len(segments[1].words) == 4
+        assert segments[1].words[3].end_offset.total_seconds() == 3.5
+
+    def test_unparseable_values_fall_back_to_builders(self, uploader):
+        conversation_data = dict(FORMATTED_CONVERSATION, medium='NOT_A_MEDIUM')
+
+        conversation = uploader._create_conversation_object(conversation_data)
+
+        assert conversation.medium == Conversation.Medium.PHONE_CALL
+        assert len(conversation.transcript.transcript_segments) == 2
+
+
+class TestSendCreate:
+    """Retry classification for CreateConversation."""
+
+    def _client(self, *outcomes):
+        calls = []
+
+        class Client:
+            async def create_conversation(self, request):
+                outcome = outcomes[len(calls)]
+                calls.append(request)
+                if isinstance(outcome, Exception):
+                    raise outcome
+                return outcome
+
+        return Client(), calls
+
+    def test_transient_errors_are_retried(self, uploader):
+        client, calls = self._client(
+            core_exceptions.ServiceUnavailable("unavailable"),
+            core_exceptions.ResourceExhausted("quota"),
+            'created',
+        )
+        uploader._next_async_client = lambda: client
+
+        assert asyncio.run(uploader._send_create(object())) == 'created'
+        assert len(calls) == 3
+
+    def test_client_errors_fail_immediately(self, uploader):
+        client, calls = self._client(core_exceptions.InvalidArgument("bad"), 'created')
+        uploader._next_async_client = lambda: client
+
+        with pytest.raises(core_exceptions.InvalidArgument):
+            asyncio.run(uploader._send_create(object()))
+        assert len(calls) == 1
+
+    def test_gives_up_after_max_attempts(self, uploader):
+        client, calls = self._client(*[core_exceptions.DeadlineExceeded("slow")] * 3)
+        uploader._next_async_client = lambda: client
+
+        with pytest.raises(core_exceptions.DeadlineExceeded):
+            asyncio.run(uploader._send_create(object()))
+        assert len(calls) == uploader._create_max_attempts
+
+
+class TestWhichExist:
+    """Batched existence checks."""
+
+    def test_batches_filters_and_caches_hits(self, uploader):
+        conversation_ids = [f'call-{i}' for i in range(250)]
+        existing = set(conversation_ids[::2])
+        batches = []
+
+        async def list_existing(id_batch):
+            batches.append(list(id_batch))
+            return existing.intersection(id_batch)
+
+        uploader._list_existing_conversation_ids = list_existing
+        batch_size = ccai_uploader._EXISTS_FILTER_BATCH_SIZE
+
+        # Duplicates are checked once
+        result = asyncio.run(uploader.which_exist(conversation_ids + conversation_ids[:10]))
+        assert result == existing
+        assert [len(batch) for batch in batches] == [batch_size, batch_size, 250 - 2 * batch_size]
+
+        # Known hits skip the RPC; only the misses are checked again
+        batches.clear()
+        assert asyncio.run(uploader.which_exist(conversation_ids)) == existing
+        assert sum(len(batch) for batch in batches) == 250 - len(existing)
+
+
+@pytest.mark.parametrize("audio_uri, folder", [
+    ('gs://bucket/calls/2024/call.wav', 'gs://bucket/calls/2024/'),
+    ('gs://bucket/calls/call.wav', 'gs://bucket/calls/'),
+    ('gs://bucket/call.wav', None),
+    ('gs://bucket/', None),
+    ('gs://bucket', None),
+    ('gs:///calls/call.wav', None),
+    ('gs://bucket/calls/', None),
+])
+def test_audio_folder(audio_uri, folder):
+    assert CCAIUploader._audio_folder(audio_uri) == folder